@@ -1,1083 +1,1922 @@
-"""
-Analyzer Pro — Python Dynamic Performance Profiler
-Compatible with: source run, PyInstaller (--onefile/--windowed), Nuitka (--onefile/--windows-disable-console)
-"""
-import sys
-import os
-import subprocess
-import psutil
-import time
-import csv
-import queue
-import threading
-import shlex
-
-import pyqtgraph as pg
-
-from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLineEdit, QTextEdit, QFileDialog, QLabel,
-    QSplitter, QGroupBox, QCheckBox, QFrame, QSizePolicy
-)
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import (
-    QTextCursor, QIcon, QTextDocument,
-    QPalette, QColor, QLinearGradient, QPainter, QBrush
-)
-from PySide6.QtPrintSupport import QPrinter
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-#  FROZEN ENVIRONMENT DETECTION
-#  Resolves the correct Python interpreter regardless of how the app was built.
-#
-#  Problem (PyInstaller --windowed / Nuitka --onefile):
-#    sys.executable → path to the frozen .exe itself (analyzer_pro.exe)
-#    Calling [sys.executable, "script.py"] re-launches THE ANALYZER, not Python.
-#
-#  Solution:
-#    1. Check for ANALYZER_PYTHON env var (advanced user override).
-#    2. Walk sys.path entries for a real python[3][w].exe / python3 binary.
-#    3. Check common Windows install locations as a last resort.
-#    4. Fall back to shutil.which("python") / which("python3").
-# ═════════════════════════════════════════════════════════════════════════════
-
-def _is_frozen() -> bool:
-    """True when running inside a PyInstaller or Nuitka bundle."""
-    return (
-        getattr(sys, "frozen", False)           # PyInstaller sets this
-        or "__compiled__" in dir(sys)           # Nuitka sets __compiled__
-        or hasattr(sys, "_MEIPASS")             # PyInstaller onefile temp dir
-    )
-
-
-def _find_python_executable() -> str:
-    """
-    Return an absolute path to a real Python interpreter suitable for
-    spawning subprocesses. Never returns the frozen bundle executable.
-    """
-    import shutil
-
-    # 1. Explicit user override via environment variable
-    override = os.environ.get("ANALYZER_PYTHON", "").strip()
-    if override and os.path.isfile(override):
-        return override
-
-    # 2. If NOT frozen, sys.executable is already the real Python
-    if not _is_frozen():
-        return sys.executable
-
-    # ── We are frozen — sys.executable is the .exe bundle, do NOT use it ──
-
-    # 3. Walk sys.path: PyInstaller/Nuitka may have left the real Python dir
-    #    in sys.path (e.g. the Scripts/ folder next to python.exe).
-    candidates = ["python.exe", "python3.exe", "python", "python3"]
-    for path_dir in sys.path:
-        if not path_dir or not os.path.isdir(path_dir):
-            continue
-        for name in candidates:
-            full = os.path.join(path_dir, name)
-            if os.path.isfile(full) and full != sys.executable:
-                return full
-        # Also check one level up (sys.path often has the Lib/ dir, not root)
-        parent = os.path.dirname(path_dir)
-        for name in candidates:
-            full = os.path.join(parent, name)
-            if os.path.isfile(full) and full != sys.executable:
-                return full
-
-    # 4. Check next to the frozen executable itself
-    exe_dir = os.path.dirname(sys.executable)
-    for name in candidates:
-        full = os.path.join(exe_dir, name)
-        if os.path.isfile(full) and full != sys.executable:
-            return full
-
-    # 5. Common Windows Python install directories
-    if sys.platform == "win32":
-        local_app = os.environ.get("LOCALAPPDATA", "")
-        program_files = [
-            os.environ.get("ProgramFiles", r"C:\Program Files"),
-            os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)"),
-            os.path.join(local_app, "Programs"),
-        ]
-        # Also check registry-style paths like C:\Python313\
-        drive = os.path.splitdrive(sys.executable)[0] or "C:"
-        for ver in ["313", "312", "311", "310", "39", "38"]:
-            program_files.append(os.path.join(drive + "\\", f"Python{ver}"))
-
-        for base in program_files:
-            if not base:
-                continue
-            # Direct match
-            for name in ["python.exe", "python3.exe"]:
-                full = os.path.join(base, name)
-                if os.path.isfile(full):
-                    return full
-            # Subdirs like Programs\Python\Python313\
-            try:
-                for sub in os.listdir(base):
-                    if sub.lower().startswith("python"):
-                        for name in ["python.exe", "python3.exe"]:
-                            full = os.path.join(base, sub, name)
-                            if os.path.isfile(full):
-                                return full
-            except (OSError, PermissionError):
-                pass
-
-    # 6. PATH lookup — last resort
-    for name in candidates:
-        found = shutil.which(name)
-        if found and os.path.isfile(found) and found != sys.executable:
-            return found
-
-    # Should never reach here; caller will show a meaningful error
-    return ""
-
-
-# Resolve once at import time
-PYTHON_EXECUTABLE = _find_python_executable()
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-#  Pipe reader helper (daemon thread)
-# ═════════════════════════════════════════════════════════════════════════════
-def _pipe_reader(stream, q, tag):
-    try:
-        for line in iter(stream.readline, ""):
-            q.put((tag, line))
-    except Exception:
-        pass
-    finally:
-        q.put((tag, None))
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-#  Background monitor thread
-# ═════════════════════════════════════════════════════════════════════════════
-class ProcessMonitorThread(QThread):
-    stats_signal    = Signal(dict)
-    finished_signal = Signal(dict)
-    log_signal      = Signal(str)
-    stdout_signal   = Signal(str)
-    stderr_signal   = Signal(str)
-
-    def __init__(self, script_path, python_exe,
-                 extra_paths=None, extra_args=None, custom_cwd=None):
-        super().__init__()
-        self.script_path   = os.path.abspath(script_path)
-        self.script_dir    = os.path.dirname(self.script_path)
-        self.python_exe    = python_exe                        # resolved interpreter
-        self.extra_paths   = extra_paths or []
-        self.extra_args    = extra_args or []
-        self.custom_cwd    = os.path.abspath(custom_cwd) if custom_cwd else self.script_dir
-        self.is_running    = True
-        self.proc          = None
-        self.tracked_pids  = set()
-        self._output_queue = queue.Queue()
-
-    # ── Build clean subprocess environment ───────────────────────────────────
-    def _build_env(self):
-        env = os.environ.copy()
-
-        # Force UTF-8 everywhere — prevents UnicodeEncodeError on Windows cp1252
-        env["PYTHONUTF8"]               = "1"
-        env["PYTHONIOENCODING"]         = "utf-8"
-        env["PYTHONLEGACYWINDOWSSTDIO"] = "0"
-
-        # When frozen, os.environ may carry PYTHONPATH pointing INTO the bundle
-        # temp dir (_MEIPASS). Strip those poisoned entries out — they are
-        # irrelevant for the external Python interpreter we are about to spawn.
-        if _is_frozen():
-            meipass = getattr(sys, "_MEIPASS", None)
-            raw_pp  = env.get("PYTHONPATH", "")
-            clean   = [
-                p for p in raw_pp.split(os.pathsep)
-                if p and (meipass is None or not p.startswith(meipass))
-            ]
-            env["PYTHONPATH"] = os.pathsep.join(clean)
-
-        # Build PYTHONPATH from the project root
-        paths = [self.script_dir, self.custom_cwd] + self.extra_paths
-
-        # Auto-discover all sub-dirs that contain Python source files
-        for root, dirs, files in os.walk(self.custom_cwd):
-            dirs[:] = [
-                d for d in dirs
-                if not d.startswith(".")
-                and d not in (
-                    "__pycache__", ".git", "node_modules",
-                    "venv", ".venv", "env", ".env", "dist", "build",
-                )
-                and not d.endswith(".egg-info")
-            ]
-            if any(f.endswith(".py") for f in files):
-                paths.append(root)
-
-        # De-duplicate, preserve order
-        seen, unique = set(), []
-        for p in paths:
-            if p not in seen:
-                seen.add(p)
-                unique.append(p)
-
-        existing_pp = env.get("PYTHONPATH", "")
-        joined      = os.pathsep.join(unique)
-        env["PYTHONPATH"] = f"{joined}{os.pathsep}{existing_pp}" if existing_pp else joined
-        return env
-
-    # ── Main run loop ─────────────────────────────────────────────────────────
-    def run(self):
-        env = self._build_env()
-        # -u = unbuffered; use the resolved real Python, never sys.executable
-        cmd = [self.python_exe, "-u", self.script_path] + self.extra_args
-
-        self.log_signal.emit(f"PYTHON ▸  {self.python_exe}")
-        self.log_signal.emit(f"CWD    ▸  {self.custom_cwd}")
-        self.log_signal.emit(f"CMD    ▸  {' '.join(cmd)}")
-        pp = env.get("PYTHONPATH", "")
-        self.log_signal.emit(
-            f"PYPATH ▸  {pp[:280]}{'…' if len(pp) > 280 else ''}"
-        )
-
-        try:
-            self.proc = subprocess.Popen(
-                cmd,
-                cwd=self.custom_cwd,
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,
-                # Windows: CREATE_NO_WINDOW prevents a flash console on --windowed builds
-                creationflags=(0x08000000 if sys.platform == "win32" else 0),
-            )
-        except FileNotFoundError:
-            self.finished_signal.emit({
-                "error":     f"Python interpreter not found: {self.python_exe}",
-                "exit_code": -1,
-                "zombies":   [],
-                "stdout":    "",
-                "stderr":    "",
-            })
-            return
-        except Exception as exc:
-            self.finished_signal.emit({
-                "error":     str(exc),
-                "exit_code": -1,
-                "zombies":   [],
-                "stdout":    "",
-                "stderr":    "",
-            })
-            return
-
-        try:
-            main_p = psutil.Process(self.proc.pid)
-            self.tracked_pids.add(self.proc.pid)
-        except psutil.NoSuchProcess:
-            self.finished_signal.emit({
-                "error": "Process exited immediately after launch.",
-                "exit_code": self.proc.returncode,
-                "zombies": [], "stdout": "", "stderr": "",
-            })
-            return
-
-        t_out = threading.Thread(
-            target=_pipe_reader,
-            args=(self.proc.stdout, self._output_queue, "out"),
-            daemon=True,
-        )
-        t_err = threading.Thread(
-            target=_pipe_reader,
-            args=(self.proc.stderr, self._output_queue, "err"),
-            daemon=True,
-        )
-        t_out.start(); t_err.start()
-
-        start_time           = time.time()
-        out_lines, err_lines = [], []
-        done_out = done_err  = False
-
-        while not (done_out and done_err):
-            # Drain all available items from the queue
-            try:
-                while True:
-                    tag, line = self._output_queue.get(timeout=0.05)
-                    if tag == "out":
-                        if line is None:
-                            done_out = True
-                        else:
-                            out_lines.append(line)
-                            self.stdout_signal.emit(line.rstrip("\n"))
-                    else:
-                        if line is None:
-                            done_err = True
-                        else:
-                            err_lines.append(line)
-                            self.stderr_signal.emit(line.rstrip("\n"))
-            except queue.Empty:
-                pass
-
-            if not self.is_running:
-                break
-
-            # Emit perf stats while the process is alive
-            if self.proc.poll() is None:
-                try:
-                    children      = main_p.children(recursive=True)
-                    self.tracked_pids.update(c.pid for c in children)
-                    total_mem     = main_p.memory_info().rss
-                    total_cpu     = main_p.cpu_percent(interval=None)
-                    total_threads = main_p.num_threads()
-                    for child in children:
-                        try:
-                            total_mem     += child.memory_info().rss
-                            total_cpu     += child.cpu_percent(interval=None)
-                            total_threads += child.num_threads()
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
-                    self.stats_signal.emit({
-                        "time":        round(time.time() - start_time, 2),
-                        "mem_mb":      total_mem / (1024 * 1024),
-                        "cpu_percent": total_cpu,
-                        "threads":     total_threads,
-                        "children":    len(children),
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-
-        self.proc.wait()
-        t_out.join(timeout=2); t_err.join(timeout=2)
-        self._cleanup_and_report(out_lines, err_lines)
-
-    def _cleanup_and_report(self, out_lines, err_lines):
-        time.sleep(0.4)
-        zombies = []
-        for pid in self.tracked_pids:
-            if psutil.pid_exists(pid):
-                try:
-                    p = psutil.Process(pid)
-                    if p.status() != psutil.STATUS_ZOMBIE:
-                        zombies.append(f"PID {pid}  ({p.name()})")
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-        self.finished_signal.emit({
-            "zombies":   zombies,
-            "stdout":    "".join(out_lines),
-            "stderr":    "".join(err_lines),
-            "exit_code": self.proc.returncode if self.proc else None,
-        })
-
-    def stop_process(self):
-        self.is_running = False
-        if self.proc and self.proc.poll() is None:
-            self.log_signal.emit("KILL  ▸  Terminating process tree…")
-            try:
-                parent = psutil.Process(self.proc.pid)
-                for child in parent.children(recursive=True):
-                    child.kill()
-                parent.kill()
-            except psutil.NoSuchProcess:
-                pass
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-#  Accent bar widget
-# ═════════════════════════════════════════════════════════════════════════════
-class AccentBar(QFrame):
-    def __init__(self, c1="#00d4aa", c2="#60a5fa", parent=None):
-        super().__init__(parent)
-        self.c1 = c1; self.c2 = c2
-        self.setFixedHeight(2)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-
-    def paintEvent(self, _):
-        p = QPainter(self)
-        grad = QLinearGradient(0, 0, self.width(), 0)
-        grad.setColorAt(0.0, QColor(self.c1))
-        grad.setColorAt(0.5, QColor(self.c2))
-        grad.setColorAt(1.0, QColor(self.c1))
-        p.fillRect(self.rect(), QBrush(grad))
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-#  Stat badge widget
-# ═════════════════════════════════════════════════════════════════════════════
-class StatBadge(QFrame):
-    def __init__(self, label, unit, accent="#00d4aa", parent=None):
-        super().__init__(parent)
-        self.setObjectName("StatBadge")
-        self.setFixedHeight(60)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 6, 12, 6)
-        layout.setSpacing(6)
-
-        left = QVBoxLayout()
-        left.setSpacing(0)
-        lbl_top = QLabel(label.upper())
-        lbl_top.setStyleSheet(
-            "color: #2e3555; font-size: 9px; letter-spacing: 1.5px; background: transparent;"
-        )
-        lbl_unit = QLabel(unit)
-        lbl_unit.setStyleSheet("color: #2e3555; font-size: 9px; background: transparent;")
-        left.addWidget(lbl_top)
-        left.addWidget(lbl_unit)
-
-        self.value_lbl = QLabel("—")
-        self.value_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self._accent = accent
-        self.value_lbl.setStyleSheet(
-            f"color: {accent}; font-size: 18px; font-weight: 700;"
-            " font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;"
-            " background: transparent;"
-        )
-        layout.addLayout(left)
-        layout.addWidget(self.value_lbl, 1)
-
-    def set_value(self, v, color=None):
-        self.value_lbl.setText(str(v))
-        if color:
-            self.value_lbl.setStyleSheet(
-                f"color: {color}; font-size: 18px; font-weight: 700;"
-                " font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;"
-                " background: transparent;"
-            )
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-#  Stylesheet
-# ═════════════════════════════════════════════════════════════════════════════
-STYLESHEET = """
-    * { box-sizing: border-box; }
-    QMainWindow, QWidget        { background: #0c0e18; color: #dde1ec; }
-    QSplitter::handle           { background: #181b2a; }
-
-    QLineEdit {
-        background: #13162a;
-        color: #dde1ec;
-        border: 1px solid #252840;
-        border-radius: 5px;
-        padding: 6px 10px;
-        font-size: 12px;
-    }
-    QLineEdit:focus     { border: 1px solid #00d4aa; }
-    QLineEdit:disabled  { background: #0d0f1a; color: #2d3148; }
-
-    QPushButton {
-        background: #181b2e;
-        color: #8892a4;
-        border: 1px solid #252840;
-        border-radius: 5px;
-        padding: 6px 14px;
-        font-size: 12px;
-        font-weight: 600;
-    }
-    QPushButton:hover    { background: #20243a; border-color: #00d4aa88; color: #00d4aa; }
-    QPushButton:disabled { background: #0e101a; color: #2d3148; border-color: #181b2a; }
-
-    QPushButton#run_btn {
-        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-            stop:0 #009e7a, stop:1 #00c99e);
-        color: #051a14;
-        border: none;
-        font-weight: 700;
-        font-size: 12px;
-        letter-spacing: 0.5px;
-    }
-    QPushButton#run_btn:hover    { background: #00e4b5; color: #020f0b; }
-    QPushButton#run_btn:disabled { background: #0d1f19; color: #1a3d2e; border: none; }
-
-    QPushButton#stop_btn {
-        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-            stop:0 #9b1c1c, stop:1 #dc2626);
-        color: #fff;
-        border: none;
-        font-weight: 700;
-        font-size: 12px;
-    }
-    QPushButton#stop_btn:hover    { background: #ef4444; }
-    QPushButton#stop_btn:disabled { background: #130a0a; color: #3d1515; border: none; }
-
-    QGroupBox {
-        border: 1px solid #1c1f34;
-        border-radius: 7px;
-        margin-top: 14px;
-        padding-top: 4px;
-        font-size: 10px;
-        font-weight: 700;
-        letter-spacing: 2px;
-        color: #2e3555;
-    }
-    QGroupBox::title {
-        subcontrol-origin: margin;
-        left: 12px;
-        padding: 0 6px;
-        background: #0c0e18;
-    }
-
-    QTextEdit {
-        background: #07090f;
-        color: #b8c2d8;
-        border: 1px solid #1c1f34;
-        border-radius: 6px;
-        font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;
-        font-size: 11px;
-        padding: 6px 8px;
-        selection-background-color: #00d4aa30;
-    }
-
-    QFrame#StatBadge {
-        background: #0f1120;
-        border: 1px solid #1c1f34;
-        border-radius: 7px;
-    }
-
-    QCheckBox { color: #3d4460; font-size: 11px; spacing: 6px; }
-    QCheckBox::indicator {
-        width: 13px; height: 13px;
-        border: 1px solid #252840;
-        border-radius: 3px;
-        background: #13162a;
-    }
-    QCheckBox::indicator:checked { background: #00d4aa; border-color: #00d4aa; }
-
-    QLabel#sec { color: #2e3555; font-size: 10px; letter-spacing: 1.5px; }
-
-    QScrollBar:vertical   { background: #07090f; width: 7px; }
-    QScrollBar::handle:vertical {
-        background: #252840; border-radius: 3px; min-height: 20px;
-    }
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
-    QScrollBar:horizontal { background: #07090f; height: 7px; }
-    QScrollBar::handle:horizontal {
-        background: #252840; border-radius: 3px; min-width: 20px;
-    }
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0; }
-"""
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-#  Main window
-# ═════════════════════════════════════════════════════════════════════════════
-class AnalyzerApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Analyzer Pro")
-        self.resize(1280, 900)
-        self.setMinimumSize(920, 660)
-
-        # Icon resolution — works for source, PyInstaller _MEIPASS, and Nuitka
-        icon_path = self._resolve_asset("analyzer.ico")
-        if icon_path:
-            self.setWindowIcon(QIcon(icon_path))
-
-        self.setStyleSheet(STYLESHEET)
-        self.time_data, self.mem_data, self.cpu_data = [], [], []
-        self.monitor_thread = None
-
-        # Current resolved Python executable (can be overridden by user)
-        self._python_exe = PYTHON_EXECUTABLE
-
-        self._build_ui()
-
-        # Warn if no interpreter was found at startup
-        if not self._python_exe or not os.path.isfile(self._python_exe):
-            self._log(
-                "WARNING  ▸  Could not auto-detect a Python interpreter. "
-                "Please set one manually via the Python field above.",
-                "#fbbf24",
-            )
-        else:
-            self._log(f"PYTHON ▸  {self._python_exe}", "#3a3f5c")
-
-    @staticmethod
-    def _resolve_asset(filename: str) -> str:
-        """Find a bundled asset regardless of run mode."""
-        # 1. PyInstaller _MEIPASS temp dir
-        meipass = getattr(sys, "_MEIPASS", None)
-        if meipass:
-            p = os.path.join(meipass, filename)
-            if os.path.isfile(p):
-                return p
-        # 2. Nuitka: assets are next to the executable
-        exe_dir = os.path.dirname(os.path.abspath(sys.executable))
-        p = os.path.join(exe_dir, filename)
-        if os.path.isfile(p):
-            return p
-        # 3. Source run: same directory as this script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        p = os.path.join(script_dir, filename)
-        if os.path.isfile(p):
-            return p
-        return ""
-
-    # ── Label helper ─────────────────────────────────────────────────────────
-    def _sec(self, text):
-        lbl = QLabel(text.upper())
-        lbl.setObjectName("sec")
-        return lbl
-
-    # ── Build UI ─────────────────────────────────────────────────────────────
-    def _build_ui(self):
-        root_w = QWidget()
-        self.setCentralWidget(root_w)
-        root = QVBoxLayout(root_w)
-        root.setContentsMargins(12, 8, 12, 8)
-        root.setSpacing(5)
-
-        # ── Header ────────────────────────────────────────────────────────────
-        hdr = QHBoxLayout(); hdr.setSpacing(0)
-        t1 = QLabel("ANALYZER")
-        t1.setStyleSheet(
-            "color: #00d4aa; font-size: 14px; font-weight: 800; letter-spacing: 5px;"
-            " font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;"
-        )
-        t2 = QLabel(" PRO")
-        t2.setStyleSheet(
-            "color: #60a5fa; font-size: 14px; font-weight: 800; letter-spacing: 5px;"
-            " font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;"
-        )
-        sub = QLabel("  ·  Python Dynamic Performance Profiler")
-        sub.setStyleSheet("color: #2e3555; font-size: 10px; letter-spacing: 0.5px;")
-        hdr.addWidget(t1); hdr.addWidget(t2); hdr.addWidget(sub)
-        hdr.addStretch()
-        root.addLayout(hdr)
-        root.addWidget(AccentBar("#00d4aa", "#60a5fa"))
-        root.addSpacing(1)
-
-        # ── Config ────────────────────────────────────────────────────────────
-        cfg = QGroupBox("Configuration")
-        cfl = QVBoxLayout(cfg)
-        cfl.setSpacing(6)
-        cfl.setContentsMargins(10, 16, 10, 8)
-
-        # Row 0: Python interpreter (critical for frozen builds)
-        r0 = QHBoxLayout(); r0.setSpacing(6)
-        r0.addWidget(self._sec("Python  "))
-        self.python_input = QLineEdit()
-        self.python_input.setText(self._python_exe)
-        self.python_input.setPlaceholderText(
-            "Path to python.exe / python3  (auto-detected) …"
-        )
-        self.python_input.textChanged.connect(self._on_python_changed)
-        btn_py = QPushButton("Browse"); btn_py.setFixedWidth(78)
-        btn_py.clicked.connect(self.browse_python)
-        r0.addWidget(self.python_input); r0.addWidget(btn_py)
-        cfl.addLayout(r0)
-
-        # Row 1: Script
-        r1 = QHBoxLayout(); r1.setSpacing(6)
-        r1.addWidget(self._sec("Script  "))
-        self.file_input = QLineEdit()
-        self.file_input.setPlaceholderText("Select Python entry-point  (*.py) …")
-        btn_f = QPushButton("Browse"); btn_f.setFixedWidth(78)
-        btn_f.clicked.connect(self.browse_file)
-        r1.addWidget(self.file_input); r1.addWidget(btn_f)
-        cfl.addLayout(r1)
-
-        # Row 2: Working dir
-        r2 = QHBoxLayout(); r2.setSpacing(6)
-        r2.addWidget(self._sec("Work Dir"))
-        self.cwd_input = QLineEdit()
-        self.cwd_input.setPlaceholderText("Defaults to script's parent folder …")
-        btn_d = QPushButton("Browse"); btn_d.setFixedWidth(78)
-        btn_d.clicked.connect(self.browse_dir)
-        self.auto_cwd_chk = QCheckBox("Auto")
-        self.auto_cwd_chk.setChecked(True)
-        self.auto_cwd_chk.stateChanged.connect(self._toggle_cwd)
-        self._toggle_cwd(Qt.Checked)
-        r2.addWidget(self.cwd_input); r2.addWidget(btn_d); r2.addWidget(self.auto_cwd_chk)
-        cfl.addLayout(r2)
-
-        # Row 3: Extra paths + args
-        r3 = QHBoxLayout(); r3.setSpacing(12)
-        pc = QVBoxLayout(); pc.setSpacing(4)
-        pc.addWidget(self._sec("Extra PYTHONPATH"))
-        ep = QHBoxLayout(); ep.setSpacing(4)
-        self.extra_path_input = QLineEdit()
-        self.extra_path_input.setPlaceholderText(
-            "Additional paths (auto-discovers by default) …"
-        )
-        btn_ep = QPushButton("+"); btn_ep.setFixedWidth(30)
-        btn_ep.clicked.connect(self.add_extra_path)
-        ep.addWidget(self.extra_path_input); ep.addWidget(btn_ep)
-        pc.addLayout(ep)
-
-        ac = QVBoxLayout(); ac.setSpacing(4)
-        ac.addWidget(self._sec("Arguments"))
-        self.args_input = QLineEdit()
-        self.args_input.setPlaceholderText(
-            "--debug  --port 8080  --config cfg.yaml …"
-        )
-        ac.addWidget(self.args_input)
-
-        r3.addLayout(pc, 3); r3.addLayout(ac, 2)
-        cfl.addLayout(r3)
-        root.addWidget(cfg)
-
-        # ── Action row ────────────────────────────────────────────────────────
-        ar = QHBoxLayout(); ar.setSpacing(6)
-        self.run_btn = QPushButton("▶  Run & Analyze")
-        self.run_btn.setObjectName("run_btn")
-        self.run_btn.setFixedHeight(30); self.run_btn.setFixedWidth(160)
-        self.run_btn.clicked.connect(self.start_analysis)
-
-        self.stop_btn = QPushButton("■  Stop")
-        self.stop_btn.setObjectName("stop_btn")
-        self.stop_btn.setFixedHeight(30); self.stop_btn.setFixedWidth(90)
-        self.stop_btn.setEnabled(False)
-        self.stop_btn.clicked.connect(self.stop_analysis)
-
-        btn_clr = QPushButton("Clear")
-        btn_clr.setFixedHeight(30); btn_clr.setFixedWidth(64)
-        btn_clr.clicked.connect(self.clear_output)
-
-        ar.addWidget(self.run_btn); ar.addWidget(self.stop_btn)
-        ar.addWidget(btn_clr); ar.addStretch()
-        root.addLayout(ar)
-
-        # ── Stat badges ───────────────────────────────────────────────────────
-        br = QHBoxLayout(); br.setSpacing(6)
-        self.b_status  = StatBadge("Status",   "",     "#00d4aa")
-        self.b_ram     = StatBadge("Memory",   "MB",   "#c084fc")
-        self.b_cpu     = StatBadge("CPU",      "%",    "#fbbf24")
-        self.b_threads = StatBadge("Threads",  "thr",  "#60a5fa")
-        self.b_child   = StatBadge("Children", "proc", "#f87171")
-        self.b_status.set_value("IDLE")
-        for b in [self.b_status, self.b_ram, self.b_cpu, self.b_threads, self.b_child]:
-            br.addWidget(b)
-        root.addLayout(br)
-        root.addSpacing(2)
-
-        # ── Splitter ──────────────────────────────────────────────────────────
-        vs = QSplitter(Qt.Vertical); vs.setHandleWidth(4)
-
-        # Graphs — side by side
-        gg = QGroupBox("Real-time Metrics")
-        ggl = QVBoxLayout(gg); ggl.setContentsMargins(4, 16, 4, 4)
-        pg.setConfigOptions(antialias=True, background="#07090f", foreground="#2e3555")
-        self.gw = pg.GraphicsLayoutWidget()
-        self.gw.setBackground("#07090f")
-        self.gw.setFixedHeight(170)
-
-        self.plot_mem = self.gw.addPlot(row=0, col=0)
-        self.plot_mem.showGrid(x=True, y=True, alpha=0.10)
-        self.plot_mem.setLabel("left", "Memory MB", color="#c084fc", size="9pt")
-        self.plot_mem.getAxis("left").setPen(pg.mkPen("#1c1f34"))
-        self.plot_mem.getAxis("bottom").setPen(pg.mkPen("#1c1f34"))
-        self.plot_mem.getAxis("left").setTextPen(pg.mkPen("#3a3f5c"))
-        self.plot_mem.getAxis("bottom").setTextPen(pg.mkPen("#3a3f5c"))
-        self.curve_mem = self.plot_mem.plot(
-            pen=pg.mkPen("#c084fc", width=1.5),
-            fillLevel=0, brush=(192, 132, 252, 20),
-        )
-
-        self.plot_cpu = self.gw.addPlot(row=0, col=1)
-        self.plot_cpu.showGrid(x=True, y=True, alpha=0.10)
-        self.plot_cpu.setLabel("left", "CPU %", color="#fbbf24", size="9pt")
-        self.plot_cpu.getAxis("left").setPen(pg.mkPen("#1c1f34"))
-        self.plot_cpu.getAxis("bottom").setPen(pg.mkPen("#1c1f34"))
-        self.plot_cpu.getAxis("left").setTextPen(pg.mkPen("#3a3f5c"))
-        self.plot_cpu.getAxis("bottom").setTextPen(pg.mkPen("#3a3f5c"))
-        self.curve_cpu = self.plot_cpu.plot(
-            pen=pg.mkPen("#fbbf24", width=1.5),
-            fillLevel=0, brush=(251, 191, 36, 20),
-        )
-
-        ggl.addWidget(self.gw)
-        vs.addWidget(gg)
-
-        # Output panes
-        hs = QSplitter(Qt.Horizontal); hs.setHandleWidth(4)
-
-        og = QGroupBox("Program Output — stdout")
-        ogl = QVBoxLayout(og); ogl.setContentsMargins(6, 16, 6, 6); ogl.setSpacing(4)
-        self.stdout_area = QTextEdit(); self.stdout_area.setReadOnly(True)
-        self.stdout_area.document().setDocumentMargin(8)
-        ogl.addWidget(self.stdout_area)
-        hs.addWidget(og)
-
-        lg = QGroupBox("System Log — stderr / events")
-        lgl = QVBoxLayout(lg); lgl.setContentsMargins(6, 16, 6, 6); lgl.setSpacing(4)
-        self.report_area = QTextEdit(); self.report_area.setReadOnly(True)
-        self.report_area.document().setDocumentMargin(8)
-        lgl.addWidget(self.report_area)
-
-        exr = QHBoxLayout(); exr.setSpacing(5)
-        bp = QPushButton("Export PDF"); bp.setFixedHeight(24)
-        bc = QPushButton("Export CSV"); bc.setFixedHeight(24)
-        bp.clicked.connect(self.export_pdf)
-        bc.clicked.connect(self.export_csv)
-        exr.addWidget(bp); exr.addWidget(bc); exr.addStretch()
-        lgl.addLayout(exr)
-
-        hs.addWidget(lg)
-        hs.setSizes([620, 620])
-        vs.addWidget(hs)
-        vs.setSizes([190, 520])
-        root.addWidget(vs)
-
-    # ── UI helpers ───────────────────────────────────────────────────────────
-    def _toggle_cwd(self, state):
-        self.cwd_input.setEnabled(state != Qt.Checked)
-
-    def _on_python_changed(self, text):
-        self._python_exe = text.strip()
-
-    def browse_python(self):
-        if sys.platform == "win32":
-            filt = "Python Executable (python.exe python3.exe);;All Files (*)"
-        else:
-            filt = "Python Executable (python python3);;All Files (*)"
-        p, _ = QFileDialog.getOpenFileName(self, "Select Python Interpreter", "", filt)
-        if p:
-            self._python_exe = p
-            self.python_input.setText(p)
-
-    def browse_file(self):
-        p, _ = QFileDialog.getOpenFileName(
-            self, "Select Entry-point Script", "", "Python Files (*.py)"
-        )
-        if p:
-            self.file_input.setText(p)
-            if self.auto_cwd_chk.isChecked():
-                self.cwd_input.setText(os.path.dirname(p))
-
-    def browse_dir(self):
-        p = QFileDialog.getExistingDirectory(
-            self, "Select Working / Project Directory"
-        )
-        if p:
-            self.auto_cwd_chk.setChecked(False)
-            self.cwd_input.setEnabled(True)
-            self.cwd_input.setText(p)
-
-    def add_extra_path(self):
-        p = QFileDialog.getExistingDirectory(
-            self, "Add Extra PYTHONPATH Directory"
-        )
-        if p:
-            cur = self.extra_path_input.text().strip()
-            sep = os.pathsep
-            self.extra_path_input.setText(f"{cur}{sep}{p}" if cur else p)
-
-    def clear_output(self):
-        self.stdout_area.clear()
-        self.report_area.clear()
-
-    def _log(self, text, color="#2e3555"):
-        safe = (text.replace("&", "&amp;")
-                    .replace("<", "&lt;")
-                    .replace(">", "&gt;"))
-        self.report_area.append(
-            f"<span style='color:{color};font-family:monospace;'>{safe}</span>"
-        )
-        self.report_area.moveCursor(QTextCursor.End)
-
-    def _out(self, text):
-        safe = (text.replace("&", "&amp;")
-                    .replace("<", "&lt;")
-                    .replace(">", "&gt;"))
-        self.stdout_area.append(
-            f"<span style='color:#b8c2d8;font-family:monospace;'>{safe}</span>"
-        )
-        self.stdout_area.moveCursor(QTextCursor.End)
-
-    # ── Analysis lifecycle ────────────────────────────────────────────────────
-    def start_analysis(self):
-        # Validate Python interpreter
-        python_exe = self.python_input.text().strip() or self._python_exe
-        if not python_exe or not os.path.isfile(python_exe):
-            self._log(
-                "ERROR  ▸  Python interpreter not found. "
-                "Please browse to python.exe manually.",
-                "#ef4444",
-            )
-            return
-
-        # Validate script
-        script_path = self.file_input.text().strip()
-        if not script_path or not os.path.exists(script_path):
-            self._log("ERROR  ▸  Script file not found.", "#ef4444")
-            return
-
-        # Working directory
-        if self.auto_cwd_chk.isChecked() or not self.cwd_input.text().strip():
-            cwd = os.path.dirname(os.path.abspath(script_path))
-        else:
-            cwd = self.cwd_input.text().strip()
-            if not os.path.isdir(cwd):
-                self._log(f"ERROR  ▸  Working directory not found: {cwd}", "#ef4444")
-                return
-
-        # Extra PYTHONPATH
-        raw_extra = self.extra_path_input.text().strip()
-        extra_paths = []
-        if raw_extra:
-            for p in raw_extra.replace(";", os.pathsep).split(os.pathsep):
-                p = p.strip()
-                if p and os.path.isdir(p):
-                    extra_paths.append(p)
-
-        # Script arguments
-        raw_args   = self.args_input.text().strip()
-        extra_args = shlex.split(raw_args) if raw_args else []
-
-        # Reset
-        self.clear_output()
-        self.time_data, self.mem_data, self.cpu_data = [], [], []
-        self.curve_mem.setData([], []); self.curve_cpu.setData([], [])
-
-        self._log(f"START  ▸  {os.path.basename(script_path)}", "#00d4aa")
-        self._log(f"CWD    ▸  {cwd}", "#60a5fa")
-        if extra_paths: self._log(f"PATHS  ▸  {extra_paths}", "#a78bfa")
-        if extra_args:  self._log(f"ARGS   ▸  {extra_args}", "#a78bfa")
-        self._log("─" * 60, "#1c1f34")
-
-        self.run_btn.setEnabled(False)
-        self.stop_btn.setEnabled(True)
-        self.b_status.set_value("RUN", "#00d4aa")
-
-        self.monitor_thread = ProcessMonitorThread(
-            script_path,
-            python_exe=python_exe,
-            extra_paths=extra_paths,
-            extra_args=extra_args,
-            custom_cwd=cwd,
-        )
-        self.monitor_thread.stats_signal.connect(self._update_stats)
-        self.monitor_thread.finished_signal.connect(self._finish_analysis)
-        self.monitor_thread.log_signal.connect(lambda t: self._log(t, "#3a3f5c"))
-        self.monitor_thread.stdout_signal.connect(self._out)
-        self.monitor_thread.stderr_signal.connect(lambda l: self._log(l, "#f87171"))
-        self.monitor_thread.start()
-
-    def _update_stats(self, data):
-        self.b_ram.set_value(f"{data['mem_mb']:.1f}")
-        self.b_cpu.set_value(f"{data['cpu_percent']:.1f}")
-        self.b_threads.set_value(str(data["threads"]))
-        self.b_child.set_value(str(data["children"]))
-        self.time_data.append(data["time"])
-        self.mem_data.append(data["mem_mb"])
-        self.cpu_data.append(data["cpu_percent"])
-        self.curve_mem.setData(self.time_data, self.mem_data)
-        self.curve_cpu.setData(self.time_data, self.cpu_data)
-
-    def stop_analysis(self):
-        if self.monitor_thread and self.monitor_thread.isRunning():
-            self.monitor_thread.stop_process()
-            self.stop_btn.setEnabled(False)
-
-    def _finish_analysis(self, result):
-        self.run_btn.setEnabled(True)
-        self.stop_btn.setEnabled(False)
-
-        # Surface any launch error prominently
-        if result.get("error"):
-            self._log(f"ERROR  ▸  {result['error']}", "#ef4444")
-            self.b_status.set_value("ERR", "#ef4444")
-            self._log("─" * 60, "#1c1f34")
-            return
-
-        exit_code = result.get("exit_code")
-        ok = exit_code == 0
-        self.b_status.set_value("OK" if ok else "ERR",
-                                "#00d4aa" if ok else "#ef4444")
-        self._log("─" * 60, "#1c1f34")
-        self._log("RESULTS", "#60a5fa")
-        if exit_code is not None:
-            self._log(f"Exit Code  ▸  {exit_code}",
-                      "#00d4aa" if ok else "#ef4444")
-        zombies = result.get("zombies", [])
-        if zombies:
-            self._log("LEAKED PROCESSES:", "#ef4444")
-            for z in zombies:
-                self._log(f"  · {z}", "#fbbf24")
-            self._log("Tip: use daemon=True on background threads.", "#4b5563")
-        else:
-            self._log("No leaked / zombie processes detected.", "#00d4aa")
-        self._log("─" * 60, "#1c1f34")
-
-    # ── Export ────────────────────────────────────────────────────────────────
-    def export_pdf(self):
-        if not self.report_area.toPlainText().strip():
-            self._log("WARNING  ▸  Nothing to export.", "#fbbf24"); return
-        p, _ = QFileDialog.getSaveFileName(
-            self, "Save PDF", "analysis_log.pdf", "PDF Files (*.pdf)"
-        )
-        if p:
-            try:
-                pr = QPrinter(QPrinter.HighResolution)
-                pr.setOutputFormat(QPrinter.PdfFormat)
-                pr.setOutputFileName(p)
-                doc = QTextDocument()
-                doc.setHtml(self.report_area.toHtml())
-                doc.print_(pr)
-                self._log(f"PDF saved  ▸  {p}", "#00d4aa")
-            except Exception as e:
-                self._log(f"ERROR  ▸  {e}", "#ef4444")
-
-    def export_csv(self):
-        if not self.time_data:
-            self._log("WARNING  ▸  No metrics yet.", "#fbbf24"); return
-        p, _ = QFileDialog.getSaveFileName(
-            self, "Save CSV", "metrics.csv", "CSV Files (*.csv)"
-        )
-        if p:
-            try:
-                with open(p, "w", newline="", encoding="utf-8") as f:
-                    w = csv.writer(f)
-                    w.writerow(["Time (s)", "Memory (MB)", "CPU (%)"])
-                    for t, m, c in zip(self.time_data, self.mem_data, self.cpu_data):
-                        w.writerow([t, m, c])
-                self._log(f"CSV saved  ▸  {p}", "#00d4aa")
-            except Exception as e:
-                self._log(f"ERROR  ▸  {e}", "#ef4444")
-
-
-# ═════════════════════════════════════════════════════════════════════════════
-#  Entry point
-# ═════════════════════════════════════════════════════════════════════════════
-if __name__ == "__main__":
-    # Nuitka: bootstrap multiprocessing support (must be first)
-    if "__compiled__" in dir(sys):
-        import multiprocessing
-        multiprocessing.freeze_support()
-
-    # PyInstaller: bootstrap multiprocessing support
-    if getattr(sys, "frozen", False):
-        import multiprocessing
-        multiprocessing.freeze_support()
-
-    # Force UTF-8 for the analyzer process itself on Windows
-    if sys.platform == "win32":
-        import io
-        if hasattr(sys.stdout, "buffer"):
-            sys.stdout = io.TextIOWrapper(
-                sys.stdout.buffer, encoding="utf-8", errors="replace"
-            )
-        if hasattr(sys.stderr, "buffer"):
-            sys.stderr = io.TextIOWrapper(
-                sys.stderr.buffer, encoding="utf-8", errors="replace"
-            )
-
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-
-    pal = QPalette()
-    pal.setColor(QPalette.Window,          QColor("#0c0e18"))
-    pal.setColor(QPalette.WindowText,      QColor("#dde1ec"))
-    pal.setColor(QPalette.Base,            QColor("#07090f"))
-    pal.setColor(QPalette.AlternateBase,   QColor("#13162a"))
-    pal.setColor(QPalette.Text,            QColor("#dde1ec"))
-    pal.setColor(QPalette.Button,          QColor("#181b2e"))
-    pal.setColor(QPalette.ButtonText,      QColor("#dde1ec"))
-    pal.setColor(QPalette.Highlight,       QColor("#00d4aa"))
-    pal.setColor(QPalette.HighlightedText, QColor("#040e0c"))
-    app.setPalette(pal)
-
-    w = AnalyzerApp()
-    w.show()
-    sys.exit(app.exec())
+"""
+Analyzer Pro — Python Dynamic Performance Profiler
+Compatible with: source run, PyInstaller (--onefile/--windowed), Nuitka (--onefile/--windows-disable-console)
+"""
+import sys
+import os
+import io
+import subprocess
+import psutil
+import tempfile
+import time
+import collections
+import functools
+import re
+import selectors
+import signal
+import stat
+import threading
+import shlex
+from typing import NamedTuple
+
+import numpy as np
+
+# pyqtgraph and QtPrintSupport are heavy (~200 ms import, tens of MB RSS)
+# and not needed to show the window — they are imported lazily at the point
+# of first use (_build_ui graphs / PDF export).
+
+from PySide6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QLineEdit, QPlainTextEdit, QFileDialog, QLabel,
+    QSplitter, QGroupBox, QCheckBox, QFrame, QSizePolicy
+)
+from PySide6.QtCore import (
+    Qt, QEvent, QRunnable, QThread, QThreadPool, QTimer, Signal
+)
+from PySide6.QtGui import (
+    QTextCursor, QTextCharFormat, QIcon, QTextDocument,
+    QPalette, QColor, QLinearGradient, QPainter, QBrush
+)
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  FROZEN ENVIRONMENT DETECTION
+#  Resolves the correct Python interpreter regardless of how the app was built.
+#
+#  Problem (PyInstaller --windowed / Nuitka --onefile):
+#    sys.executable → path to the frozen .exe itself (analyzer_pro.exe)
+#    Calling [sys.executable, "script.py"] re-launches THE ANALYZER, not Python.
+#
+#  Solution:
+#    1. Check for ANALYZER_PYTHON env var (advanced user override).
+#    2. Walk sys.path entries for a real python[3][w].exe / python3 binary.
+#    3. Check common Windows install locations as a last resort.
+#    4. Fall back to shutil.which("python") / which("python3").
+# ═════════════════════════════════════════════════════════════════════════════
+
+def _is_frozen() -> bool:
+    """True when running inside a PyInstaller or Nuitka bundle."""
+    return (
+        getattr(sys, "frozen", False)           # PyInstaller sets this
+        or "__compiled__" in dir(sys)           # Nuitka sets __compiled__
+        or hasattr(sys, "_MEIPASS")             # PyInstaller onefile temp dir
+    )
+
+
+_PYTHON_CACHE_VERSION = "cache_v1"
+
+
+def _python_cache_file() -> str:
+    """Per-user cache file holding the last resolved interpreter path."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "analyzer-pro", "python_exe.txt")
+
+
+def _find_python_executable() -> str:
+    """
+    Return an absolute path to a real Python interpreter suitable for
+    spawning subprocesses. Never returns the frozen bundle executable.
+
+    When frozen, the expensive filesystem scan can stat hundreds of paths,
+    so a successful result is persisted to a per-user cache file and
+    re-validated with a single isfile() on the next startup.
+    """
+    # 1. Explicit user override via environment variable — bypasses (and
+    #    supersedes) any cached result.
+    override = os.environ.get("ANALYZER_PYTHON", "").strip()
+    if override and os.path.isfile(override):
+        return override
+
+    # 2. If NOT frozen, sys.executable is already the real Python
+    if not _is_frozen():
+        return sys.executable
+
+    # 3. Cached result from a previous scan (frozen builds only)
+    cache_path = _python_cache_file()
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            stamp, _, cached = f.read().partition("\n")
+        cached = cached.strip()
+        if (stamp == _PYTHON_CACHE_VERSION and cached
+                and cached != sys.executable and os.path.isfile(cached)):
+            return cached
+    except OSError:
+        pass
+
+    found = _scan_for_python()
+    if found:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                f.write(f"{_PYTHON_CACHE_VERSION}\n{found}\n")
+        except OSError:
+            pass
+    return found
+
+
+def _scan_for_python() -> str:
+    """Full filesystem scan for a usable interpreter (frozen builds only)."""
+    import shutil
+
+    # ── We are frozen — sys.executable is the .exe bundle, do NOT use it ──
+
+    # 3. One which() per candidate over sys.path entries, their parents
+    #    (sys.path often has the Lib/ dir, not the install root) and the
+    #    frozen exe's own directory. which() delegates to the C-optimized
+    #    PATH walker, short-circuits on first hit, and handles PATHEXT
+    #    correctly on Windows.
+    candidates = ["python.exe", "python3.exe", "python", "python3"]
+    dirs = []
+    for path_dir in sys.path:
+        if path_dir and os.path.isdir(path_dir):
+            dirs.append(path_dir)
+            dirs.append(os.path.dirname(path_dir))
+    dirs.append(os.path.dirname(sys.executable))
+    search_path = os.pathsep.join(dict.fromkeys(dirs))
+    for name in candidates:
+        found = shutil.which(name, path=search_path)
+        if found and found != sys.executable:
+            return found
+
+    # 5. Common Windows Python install directories
+    if sys.platform == "win32":
+        local_app = os.environ.get("LOCALAPPDATA", "")
+        bases = [
+            os.environ.get("ProgramFiles", r"C:\Program Files"),
+            os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)"),
+            os.path.join(local_app, "Programs"),
+        ]
+        # Also check registry-style paths like C:\Python313\
+        drive = os.path.splitdrive(sys.executable)[0] or "C:"
+        for ver in ["313", "312", "311", "310", "39", "38"]:
+            bases.append(os.path.join(drive + "\\", f"Python{ver}"))
+
+        win_dirs = []
+        for base in bases:
+            if not base:
+                continue
+            win_dirs.append(base)
+            # Subdirs like Programs\Python\Python313\
+            try:
+                for sub in os.listdir(base):
+                    if sub.lower().startswith("python"):
+                        win_dirs.append(os.path.join(base, sub))
+            except (OSError, PermissionError):
+                pass
+        search_path = os.pathsep.join(dict.fromkeys(win_dirs))
+        for name in ["python.exe", "python3.exe"]:
+            found = shutil.which(name, path=search_path)
+            if found:
+                return found
+
+    # 6. PATH lookup — last resort
+    for name in candidates:
+        found = shutil.which(name)
+        if found and os.path.isfile(found) and found != sys.executable:
+            return found
+
+    # Should never reach here; caller will show a meaningful error
+    return ""
+
+
+@functools.lru_cache(maxsize=1)
+def get_python_executable() -> str:
+    """Resolve (and memoize) the interpreter lazily — importing this module
+    never pays for the filesystem scan."""
+    return _find_python_executable()
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  PYTHONPATH auto-discovery
+# ═════════════════════════════════════════════════════════════════════════════
+_SKIP_DIRS = frozenset({
+    "__pycache__", ".git", "node_modules",
+    "venv", ".venv", "env", ".env", "dist", "build",
+})
+
+
+@functools.lru_cache(maxsize=8)
+def _discover_py_dirs(cwd: str, mtime: float) -> tuple:
+    """
+    Walk *cwd* and collect every directory containing Python source files.
+    Cached on (cwd, mtime) so repeated Runs of the same project skip the
+    full stat storm; touching the project root invalidates the entry.
+
+    Uses an iterative os.scandir traversal: DirEntry.is_dir() comes from the
+    readdir entry itself, avoiding the per-entry stat that os.walk pays.
+    """
+    found = []
+    stack = [cwd]
+    while stack:
+        d = stack.pop()
+        subdirs, has_py, has_marker = [], False, False
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    name = e.name
+                    try:
+                        is_dir = e.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if (name.startswith(".") or name in _SKIP_DIRS
+                                or name.endswith(".egg-info")):
+                            continue
+                        subdirs.append(e.path)
+                    else:
+                        if not has_py and name.endswith(".py"):
+                            has_py = True
+                        if d == cwd and name in ("pyproject.toml", "setup.py"):
+                            has_marker = True
+        except OSError:
+            continue
+        # A packaged project keeps its code under conventional source dirs —
+        # a marker at the root lets us skip docs/assets trees entirely.
+        if has_marker:
+            keep = [
+                p for p in subdirs
+                if os.path.basename(p) in ("src", "tests")
+            ]
+            if keep:
+                subdirs = keep
+        stack.extend(subdirs)
+        if has_py:
+            found.append(d)
+    return tuple(found)
+
+
+@functools.lru_cache(maxsize=32)
+def _make_pythonpath(paths: tuple, existing: str) -> str:
+    """
+    Join *paths* with the inherited PYTHONPATH in one deduplicated pass.
+    Also keeps inherited entries from reappearing as duplicates behind the
+    freshly discovered list. Entries are normalised first (and compared
+    case-insensitively where the filesystem is), so "C:\\Foo" and
+    "C:\\Foo\\" collapse to one entry — every duplicate left in would be
+    re-statted by the child on each import. Cached so repeated Runs of the
+    same config skip the rebuild entirely.
+    """
+    parts = {}
+    for p in (*paths, *(existing.split(os.pathsep) if existing else [])):
+        if not p:
+            continue
+        p = os.path.normpath(p)
+        parts.setdefault(os.path.normcase(p), p)
+    return os.pathsep.join(parts.values())
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Windows Job Object helper
+# ═════════════════════════════════════════════════════════════════════════════
+def _assign_job_object(pid):
+    """
+    Put *pid* into a fresh Job Object so the whole tree can later be torn
+    down with a single TerminateJobObject call. Returns the job handle, or
+    None if assignment failed (caller falls back to the psutil walk).
+    """
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    h_job = kernel32.CreateJobObjectW(None, None)
+    if not h_job:
+        return None
+    PROCESS_SET_QUOTA = 0x0100
+    PROCESS_TERMINATE = 0x0001
+    h_proc = kernel32.OpenProcess(
+        PROCESS_SET_QUOTA | PROCESS_TERMINATE, False, pid
+    )
+    if not h_proc:
+        kernel32.CloseHandle(h_job)
+        return None
+    ok = kernel32.AssignProcessToJobObject(h_job, h_proc)
+    kernel32.CloseHandle(h_proc)
+    if not ok:
+        kernel32.CloseHandle(h_job)
+        return None
+    return h_job
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Output spill buffer
+# ═════════════════════════════════════════════════════════════════════════════
+class _SpillBuffer:
+    """
+    Accumulates subprocess output as UTF-8 bytes, spilling to a temp file
+    once it grows past SPILL_THRESHOLD so a verbose target can't balloon
+    the analyzer's RSS. After finish(), the text is either returned inline
+    or left on disk at .path (never both).
+    """
+    SPILL_THRESHOLD = 16 * 1024 * 1024      # 16 MB inline, then to disk
+
+    def __init__(self):
+        self._buf  = io.BytesIO()
+        self._file = None
+        self.path  = None
+
+    def write(self, text):
+        data = text.encode("utf-8", "replace")
+        if self._file is not None:
+            self._file.write(data)
+            return
+        self._buf.write(data)
+        if self._buf.tell() > self.SPILL_THRESHOLD:
+            self._file = tempfile.NamedTemporaryFile(
+                "wb", prefix="analyzer_out_", suffix=".log", delete=False
+            )
+            self.path = self._file.name
+            self._file.write(self._buf.getvalue())
+            self._buf = None
+
+    def finish(self):
+        """Return inline text, or '' when the output was spilled to .path."""
+        if self._file is not None:
+            self._file.close()
+            return ""
+        return self._buf.getvalue().decode("utf-8", "replace")
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Pipe reader helper (daemon thread, Windows only — POSIX uses selectors)
+# ═════════════════════════════════════════════════════════════════════════════
+def _pipe_reader(stream, buf, tag, ready):
+    """Block-read a raw pipe, split complete lines, decode in userspace."""
+    tail = bytearray()
+    try:
+        fd = stream.fileno()
+        while True:
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            tail.extend(data)
+            while True:
+                nl = tail.find(b"\n")
+                if nl < 0:
+                    break
+                buf.append((tag, tail[:nl + 1].decode("utf-8", "replace")))
+                del tail[:nl + 1]
+            ready.set()
+    except Exception:
+        pass
+    finally:
+        if tail:
+            buf.append((tag, tail.decode("utf-8", "replace")))
+        buf.append((tag, None))
+        ready.set()
+
+
+class _PipeReaderTask(QRunnable):
+    """
+    QThreadPool wrapper around _pipe_reader: reader threads come from the
+    dedicated _READER_POOL below and are reused across Runs instead of
+    constructing a fresh OS thread per pipe per launch.
+    """
+    def __init__(self, stream, buf, tag, ready):
+        super().__init__()
+        self.setAutoDelete(True)
+        self._args = (stream, buf, tag, ready)
+        self._done = threading.Event()
+
+    def run(self):
+        try:
+            _pipe_reader(*self._args)
+        finally:
+            self._done.set()
+
+    def join(self, timeout=None):
+        self._done.wait(timeout)
+
+
+# The readers block until pipe EOF, so they must never queue behind each
+# other (or behind a bytecode warmup) in the core-count-sized global pool:
+# on a small machine that starves the stderr reader and deadlocks a child
+# that fills its stderr pipe. Two slots — one run at a time, two pipes.
+_READER_POOL = QThreadPool()
+_READER_POOL.setMaxThreadCount(2)
+
+
+class _BytecodeWarmupTask(QRunnable):
+    """
+    Pre-compiles the target script's directory in the background so the
+    first Run measures user code, not the importer filling __pycache__.
+    Fire-and-forget: failures just mean a cold first run, same as today.
+    """
+    def __init__(self, python_exe, script_dir):
+        super().__init__()
+        self.setAutoDelete(True)
+        self._python_exe = python_exe
+        self._script_dir = script_dir
+
+    def run(self):
+        try:
+            # The target interpreter must do the compiling — .pyc magic
+            # numbers are version-specific.
+            subprocess.run(
+                [self._python_exe, "-m", "compileall", "-q",
+                 self._script_dir],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                timeout=30,
+                creationflags=(0x08000000 if sys.platform == "win32" else 0),
+            )
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Perf-stat sampler thread
+# ═════════════════════════════════════════════════════════════════════════════
+class StatsSample(NamedTuple):
+    """One aggregated sample of the monitored tree. A fixed tuple instead of
+    a dict: no per-tick key strings to hash, and attribute access on the
+    GUI side compiles to an index load."""
+    time:        float
+    mem_mb:      float
+    cpu_percent: float
+    threads:     int
+    children:    int
+
+
+class StatSamplerThread(QThread):
+    """
+    Samples aggregate memory/CPU/thread stats for a process tree on its own
+    adaptive cadence, decoupled from pipe draining: output wants low latency,
+    stats are expensive and only need ~100-1000 ms resolution. The interval
+    starts at BASE_INTERVAL_MS and doubles after a sustained quiet stretch,
+    snapping back to base as soon as the numbers move again.
+    """
+    stats_signal = Signal(object)     # carries StatsSample
+
+    BASE_INTERVAL_MS = 100
+    MAX_INTERVAL_MS  = 1000
+    _GROWTH_WINDOW   = 20     # low-variance samples before the interval doubles
+
+    def __init__(self, main_p, tracked_pids, stop_event, parent=None):
+        super().__init__(parent)
+        self.main_p       = main_p
+        self.tracked_pids = tracked_pids          # shared with the monitor
+        self._stop_event  = stop_event
+        # psutil.Process cache keyed by pid — the Process() constructor stats
+        # /proc, and cpu_percent() deltas only work on a persistent object.
+        self._proc_cache  = {}
+        # children(recursive=True) walks the whole ppid map (~ms per call),
+        # so the child list is rescanned on a slow cadence and reused between.
+        self._cached_children    = []
+        self._last_children_scan = 0.0
+        self._last_key           = None    # last emitted (mem, cpu, thr, kids)
+
+    def run(self):
+        start_time = time.time()
+        interval   = self.BASE_INTERVAL_MS / 1000.0
+        calm_run   = 0
+        last_mem   = None
+
+        # cpu_percent(interval=None) returns 0.0 on its first call (no
+        # prior reading to diff against) — prime the baseline up front so
+        # the first emitted sample already carries a real delta.
+        try:
+            self.main_p.cpu_percent(interval=None)
+        except psutil.Error:
+            pass
+
+        while not self._stop_event.is_set():
+            try:
+                if not self.main_p.is_running():
+                    break
+            except psutil.Error:
+                break
+
+            now = time.monotonic()
+            if now - self._last_children_scan >= 1.0:
+                try:
+                    self._cached_children = self.main_p.children(recursive=True)
+                    self.tracked_pids.update(
+                        c.pid for c in self._cached_children
+                    )
+                    # Prime newly sighted children the same way as main_p,
+                    # so their first aggregated tick isn't a flat 0.0.
+                    for c in self._cached_children:
+                        if c.pid not in self._proc_cache:
+                            self._proc_cache[c.pid] = c
+                            try:
+                                c.cpu_percent(interval=None)
+                            except psutil.Error:
+                                pass
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    self._cached_children = []
+                self._last_children_scan = now
+            children = self._cached_children
+
+            # Reuse cached Process objects so cpu_percent() deltas survive
+            # across polls and the ctor's /proc stat is paid only once.
+            procs = [self.main_p] + [
+                self._proc_cache.setdefault(c.pid, c) for c in children
+            ]
+            total_mem = total_cpu = total_threads = 0
+            for p in procs:
+                try:
+                    # oneshot() coalesces the underlying per-process reads
+                    # into a single cached snapshot (~2x fewer syscalls).
+                    with p.oneshot():
+                        total_mem     += p.memory_info().rss
+                        total_cpu     += p.cpu_percent(interval=None)
+                        total_threads += p.num_threads()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    self._proc_cache.pop(p.pid, None)
+
+            mem_mb = total_mem / (1024 * 1024)
+            # Idle scripts produce identical samples for minutes at a time —
+            # skip the dict allocation and cross-thread emit entirely then.
+            key = (round(mem_mb, 1), round(total_cpu, 1),
+                   total_threads, len(children))
+            if key != self._last_key:
+                self._last_key = key
+                self.stats_signal.emit(StatsSample(
+                    time=round(time.time() - start_time, 2),
+                    mem_mb=mem_mb,
+                    cpu_percent=total_cpu,
+                    threads=total_threads,
+                    children=len(children),
+                ))
+
+            # Adaptive backoff: a quiet long-running script doesn't need
+            # 10 Hz sampling — back off toward MAX, reset on movement.
+            if last_mem is not None and abs(mem_mb - last_mem) < 1.0:
+                calm_run += 1
+                if calm_run >= self._GROWTH_WINDOW:
+                    interval = min(interval * 2,
+                                   self.MAX_INTERVAL_MS / 1000.0)
+                    calm_run = 0
+            else:
+                calm_run = 0
+                interval = self.BASE_INTERVAL_MS / 1000.0
+            last_mem = mem_mb
+
+            self._stop_event.wait(interval)
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Background monitor thread
+# ═════════════════════════════════════════════════════════════════════════════
+class ProcessMonitorThread(QThread):
+    stats_signal    = Signal(object)  # forwards StatsSample from the sampler
+    finished_signal = Signal(dict)
+    log_signal      = Signal(str)
+    stdout_signal   = Signal(str)
+    stderr_signal   = Signal(str)
+
+    def __init__(self, script_path, python_exe,
+                 extra_paths=None, extra_args=None, custom_cwd=None,
+                 merge_output=False):
+        super().__init__()
+        self.script_path   = os.path.abspath(script_path)
+        self.script_dir    = os.path.dirname(self.script_path)
+        self.python_exe    = python_exe                        # resolved interpreter
+        self.extra_paths   = extra_paths or []
+        self.extra_args    = extra_args or []
+        # Merged mode folds stderr into the stdout pipe: one fd to watch,
+        # half the drain wakeups, at the cost of stream separation.
+        self.merge_output  = merge_output
+        self.custom_cwd    = os.path.abspath(custom_cwd) if custom_cwd else self.script_dir
+        self.proc          = None
+        self.tracked_pids  = set()
+        self._stop_event   = threading.Event()    # shared with the sampler
+        self._sampler      = None
+        self._job_handle   = None                 # Windows Job Object
+        # Per-stream line batches — every emit queues a QMetaCallEvent on
+        # the GUI thread, so chatty scripts must be chunked before emitting.
+        self._batches       = {"out": [], "err": []}
+        self._batch_started = {"out": 0.0, "err": 0.0}
+
+    # ── Build clean subprocess environment ───────────────────────────────────
+    def _build_env(self):
+        env = dict(os.environ)
+
+        # Force UTF-8 everywhere — prevents UnicodeEncodeError on Windows cp1252
+        env["PYTHONUTF8"]               = "1"
+        env["PYTHONIOENCODING"]         = "utf-8"
+        env["PYTHONLEGACYWINDOWSSTDIO"] = "0"
+
+        # When frozen, os.environ may carry PYTHONPATH pointing INTO the bundle
+        # temp dir (_MEIPASS). Strip those poisoned entries out — they are
+        # irrelevant for the external Python interpreter we are about to spawn.
+        if _is_frozen():
+            meipass = getattr(sys, "_MEIPASS", None)
+            raw_pp  = env.get("PYTHONPATH", "")
+            clean   = [
+                p for p in raw_pp.split(os.pathsep)
+                if p and (meipass is None or not p.startswith(meipass))
+            ]
+            env["PYTHONPATH"] = os.pathsep.join(clean)
+
+        # Build PYTHONPATH from the project root, auto-discovering all
+        # sub-dirs with Python sources (cached across Runs of the same cwd)
+        paths = [self.script_dir, self.custom_cwd] + self.extra_paths
+        try:
+            cwd_mtime = os.stat(self.custom_cwd).st_mtime
+        except OSError:
+            cwd_mtime = 0.0
+        paths += _discover_py_dirs(self.custom_cwd, cwd_mtime)
+
+        # De-duplicate, preserve order — dict keys do both in one C-level pass
+        env["PYTHONPATH"] = _make_pythonpath(
+            tuple(dict.fromkeys(paths)), env.get("PYTHONPATH", "")
+        )
+        return env
+
+    # ── Main run loop ─────────────────────────────────────────────────────────
+    def run(self):
+        env = self._build_env()
+        # -u = unbuffered; use the resolved real Python, never sys.executable
+        cmd = [self.python_exe, "-u", self.script_path] + self.extra_args
+
+        self.log_signal.emit(f"PYTHON ▸  {self.python_exe}")
+        self.log_signal.emit(f"CWD    ▸  {self.custom_cwd}")
+        # shlex.join quotes args with spaces, so the logged line is pasteable
+        self.log_signal.emit(f"CMD    ▸  {shlex.join(cmd)}")
+        pp = env.get("PYTHONPATH", "")
+        self.log_signal.emit(
+            f"PYPATH ▸  {pp[:280]}{'…' if len(pp) > 280 else ''}"
+        )
+
+        try:
+            self.proc = subprocess.Popen(
+                cmd,
+                cwd=self.custom_cwd,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=(subprocess.STDOUT if self.merge_output
+                        else subprocess.PIPE),
+                # Raw byte pipes: no io-module line buffering or per-readline
+                # decode — lines are split and decoded in userspace instead.
+                bufsize=0,
+                # POSIX: make the child a process-group leader so the whole
+                # tree can be killed with one killpg() later.
+                start_new_session=(sys.platform != "win32"),
+                # Windows: CREATE_NO_WINDOW prevents a flash console on --windowed builds
+                creationflags=(0x08000000 if sys.platform == "win32" else 0),
+            )
+        except FileNotFoundError:
+            self.finished_signal.emit({
+                "error":     f"Python interpreter not found: {self.python_exe}",
+                "exit_code": -1,
+                "zombies":   [],
+                "stdout":    "",
+                "stderr":    "",
+            })
+            return
+        except Exception as exc:
+            self.finished_signal.emit({
+                "error":     str(exc),
+                "exit_code": -1,
+                "zombies":   [],
+                "stdout":    "",
+                "stderr":    "",
+            })
+            return
+
+        if sys.platform == "win32":
+            self._job_handle = _assign_job_object(self.proc.pid)
+
+        try:
+            main_p = psutil.Process(self.proc.pid)
+            self.tracked_pids.add(self.proc.pid)
+        except psutil.NoSuchProcess:
+            self.finished_signal.emit({
+                "error": "Process exited immediately after launch.",
+                "exit_code": self.proc.returncode,
+                "zombies": [], "stdout": "", "stderr": "",
+            })
+            return
+
+        # Stats sampling runs on its own thread and cadence; the drain loop
+        # only moves pipe bytes, so output latency never competes with /proc.
+        self._sampler = StatSamplerThread(
+            main_p, self.tracked_pids, self._stop_event
+        )
+        self._sampler.stats_signal.connect(self.stats_signal)
+        self._sampler.start()
+
+        out_buf, err_buf = _SpillBuffer(), _SpillBuffer()
+        if sys.platform == "win32":
+            self._drain_windows(out_buf, err_buf)
+        else:
+            self._drain_posix(out_buf, err_buf)
+
+        self._flush_batch("out"); self._flush_batch("err")
+
+        self.proc.wait()
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.wait(2000)
+        self._cleanup_and_report(out_buf, err_buf)
+
+    # ── Pipe draining ─────────────────────────────────────────────────────────
+    BATCH_MAX_LINES = 64      # flush a batch at this many lines…
+    BATCH_MAX_AGE   = 0.05    # …or once it is this old (seconds)
+
+    def _dispatch_line(self, tag, line, out_buf, err_buf):
+        (out_buf if tag == "out" else err_buf).write(line)
+        batch = self._batches[tag]
+        if not batch:
+            self._batch_started[tag] = time.monotonic()
+        # Raw pipes skip universal-newline translation, so Windows lines
+        # still carry \r here — strip it or every pane line double-spaces.
+        batch.append(line.rstrip("\r\n"))
+        if (len(batch) >= self.BATCH_MAX_LINES
+                or time.monotonic() - self._batch_started[tag]
+                >= self.BATCH_MAX_AGE):
+            self._flush_batch(tag)
+
+    def _flush_batch(self, tag):
+        batch = self._batches[tag]
+        if batch:
+            sig = self.stdout_signal if tag == "out" else self.stderr_signal
+            sig.emit("\n".join(batch))
+            batch.clear()
+
+    def _flush_stale_batches(self):
+        now = time.monotonic()
+        for tag, batch in self._batches.items():
+            if batch and now - self._batch_started[tag] >= self.BATCH_MAX_AGE:
+                self._flush_batch(tag)
+
+    def _drain_timeout(self):
+        """How long the drain loop may block: 0.5 s when idle, otherwise no
+        longer than the oldest pending batch's remaining age — a trailing
+        partial batch must reach the GUI at ~BATCH_MAX_AGE, not at the next
+        idle wakeup."""
+        timeout = 0.5
+        now = time.monotonic()
+        for tag, batch in self._batches.items():
+            if batch:
+                remaining = (self.BATCH_MAX_AGE
+                             - (now - self._batch_started[tag]))
+                timeout = min(timeout, max(remaining, 0.0))
+        return timeout
+
+    def _drain_posix(self, out_buf, err_buf):
+        """
+        Drain both pipes with a selector (epoll/kqueue): the thread blocks in
+        the kernel until a pipe is readable instead of waking every 50 ms to
+        poll a Python-level queue. No reader threads, no queue churn.
+        """
+        sel = selectors.DefaultSelector()
+        # fd → [tag, partial-line tail]; decoding happens per complete line,
+        # so a multi-byte UTF-8 char can never straddle a decode boundary.
+        streams = {self.proc.stdout.fileno(): ["out", bytearray()]}
+        if self.proc.stderr is not None:          # absent in merged mode
+            streams[self.proc.stderr.fileno()] = ["err", bytearray()]
+        for fd in streams:
+            sel.register(fd, selectors.EVENT_READ)
+
+        open_fds = len(streams)
+        while open_fds and not self._stop_event.is_set():
+            for key, _ in sel.select(timeout=self._drain_timeout()):
+                tag, tail = streams[key.fd]
+                try:
+                    data = os.read(key.fd, 65536)
+                except OSError:
+                    data = b""
+                if not data:                      # EOF — pipe closed
+                    sel.unregister(key.fd)
+                    open_fds -= 1
+                    if tail:
+                        self._dispatch_line(
+                            tag, tail.decode("utf-8", "replace"),
+                            out_buf, err_buf,
+                        )
+                        tail.clear()
+                    continue
+                tail.extend(data)
+                while True:
+                    nl = tail.find(b"\n")
+                    if nl < 0:
+                        break
+                    line = tail[:nl + 1].decode("utf-8", "replace")
+                    del tail[:nl + 1]
+                    self._dispatch_line(tag, line, out_buf, err_buf)
+            self._flush_stale_batches()
+        sel.close()
+
+    def _drain_windows(self, out_buf, err_buf):
+        """
+        Windows pipes can't be multiplexed with selectors, so keep blocking
+        reader threads — but feed a deque woken by a single Event per burst
+        instead of queue.Queue's per-item lock/condvar round trips.
+        """
+        buf   = collections.deque()
+        ready = threading.Event()
+        pool  = _READER_POOL
+        t_out = _PipeReaderTask(self.proc.stdout, buf, "out", ready)
+        t_err = None
+        if self.proc.stderr is not None:          # absent in merged mode
+            t_err = _PipeReaderTask(self.proc.stderr, buf, "err", ready)
+        pool.start(t_out)
+        if t_err:
+            pool.start(t_err)
+
+        done_out, done_err = False, t_err is None
+        while not (done_out and done_err):
+            ready.wait(timeout=self._drain_timeout())
+            ready.clear()
+            while buf:
+                tag, line = buf.popleft()
+                if line is None:
+                    if tag == "out":
+                        done_out = True
+                    else:
+                        done_err = True
+                else:
+                    self._dispatch_line(tag, line, out_buf, err_buf)
+            self._flush_stale_batches()
+            if self._stop_event.is_set():
+                break
+        t_out.join(timeout=2)
+        if t_err:
+            t_err.join(timeout=2)
+
+    def _cleanup_and_report(self, out_buf, err_buf):
+        zombies = []
+        # One pids() snapshot instead of a pid_exists() scan per tracked pid;
+        # wait_procs() then returns as soon as everything exits (usually well
+        # under its timeout), instead of a fixed 400 ms settling sleep.
+        alive_pids = set(psutil.pids()) & self.tracked_pids
+        procs = []
+        for pid in sorted(alive_pids):
+            try:
+                procs.append(psutil.Process(pid))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        if procs:
+            _gone, alive = psutil.wait_procs(procs, timeout=0.5)
+            for p in alive:
+                try:
+                    # oneshot() batches the status+name reads per survivor
+                    with p.oneshot():
+                        if p.status() != psutil.STATUS_ZOMBIE:
+                            zombies.append(f"PID {p.pid}  ({p.name()})")
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+        self.finished_signal.emit({
+            "zombies":     zombies,
+            "stdout":      out_buf.finish(),
+            "stderr":      err_buf.finish(),
+            "stdout_path": out_buf.path,      # set when output spilled to disk
+            "stderr_path": err_buf.path,
+            "exit_code":   self.proc.returncode if self.proc else None,
+        })
+
+    def stop_process(self):
+        self._stop_event.set()
+        if self.proc and self.proc.poll() is None:
+            self.log_signal.emit("KILL  ▸  Terminating process tree…")
+
+            # Kill the whole tree in one syscall where the platform allows it
+            if sys.platform != "win32":
+                try:
+                    os.killpg(self.proc.pid, signal.SIGKILL)
+                    return
+                except (ProcessLookupError, PermissionError, OSError):
+                    pass
+            elif self._job_handle:
+                import ctypes
+                if ctypes.windll.kernel32.TerminateJobObject(
+                        self._job_handle, 1):
+                    return
+
+            # Fallback: walk and kill each process via psutil
+            try:
+                parent = psutil.Process(self.proc.pid)
+                for child in parent.children(recursive=True):
+                    child.kill()
+                parent.kill()
+            except psutil.NoSuchProcess:
+                pass
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Accent bar widget
+# ═════════════════════════════════════════════════════════════════════════════
+class AccentBar(QFrame):
+    def __init__(self, c1="#00d4aa", c2="#60a5fa", parent=None):
+        super().__init__(parent)
+        self.c1 = c1; self.c2 = c2
+        self.setFixedHeight(2)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self._brush = QBrush()
+
+    def resizeEvent(self, ev):
+        # The gradient depends only on width — rebuild the brush here once
+        # instead of allocating gradient + brush on every repaint.
+        grad = QLinearGradient(0, 0, ev.size().width(), 0)
+        grad.setColorAt(0.0, QColor(self.c1))
+        grad.setColorAt(0.5, QColor(self.c2))
+        grad.setColorAt(1.0, QColor(self.c1))
+        self._brush = QBrush(grad)
+        super().resizeEvent(ev)
+
+    def paintEvent(self, _):
+        QPainter(self).fillRect(self.rect(), self._brush)
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Stat badge widget
+# ═════════════════════════════════════════════════════════════════════════════
+class StatBadge(QFrame):
+    def __init__(self, label, unit, accent="#00d4aa", parent=None):
+        super().__init__(parent)
+        self.setObjectName("StatBadge")
+        self.setFixedHeight(60)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(12, 6, 12, 6)
+        layout.setSpacing(6)
+
+        left = QVBoxLayout()
+        left.setSpacing(0)
+        lbl_top = QLabel(label.upper())
+        lbl_top.setStyleSheet(
+            "color: #2e3555; font-size: 9px; letter-spacing: 1.5px; background: transparent;"
+        )
+        lbl_unit = QLabel(unit)
+        lbl_unit.setStyleSheet("color: #2e3555; font-size: 9px; background: transparent;")
+        left.addWidget(lbl_top)
+        left.addWidget(lbl_unit)
+
+        self.value_lbl = QLabel("—")
+        self.value_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        self._accent = accent
+        # The app-wide QSS colours every QWidget, and a stylesheet colour
+        # always beats setPalette — so colour changes must go through QSS
+        # too. One complete string is cached per colour and only set on
+        # state transitions, never on routine value ticks, keeping the
+        # parser off the per-sample path.
+        self._css_cache = {}
+        self._last_color = None
+        self._apply_color(accent)
+        layout.addLayout(left)
+        layout.addWidget(self.value_lbl, 1)
+
+    _VALUE_CSS = (
+        "font-size: 18px; font-weight: 700;"
+        " font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;"
+        " background: transparent; color: %s;"
+    )
+
+    def _apply_color(self, color):
+        css = self._css_cache.get(color)
+        if css is None:
+            css = self._css_cache[color] = self._VALUE_CSS % color
+        self.value_lbl.setStyleSheet(css)
+        self._last_color = color
+
+    def set_value(self, v, color=None):
+        self.value_lbl.setText(str(v))
+        if color and color != self._last_color:
+            self._apply_color(color)
+
+
+# Single-pass HTML escape for export rendering (live panes are plain text)
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Accept ';' and the native separator when splitting user-entered path lists
+_PATH_SPLIT = re.compile("[;%s]" % re.escape(os.pathsep))
+
+
+def _path_kind(p: str) -> int:
+    """File type via a single stat(): S_IFREG, S_IFDIR, … or 0 if missing."""
+    try:
+        return stat.S_IFMT(os.stat(p).st_mode)
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=32)
+def _split_args(s: str) -> tuple:
+    """shlex-parsed script arguments, cached per input string — re-clicking
+    Run with unchanged inputs skips the re-parse."""
+    return tuple(shlex.split(s)) if s else ()
+
+
+@functools.lru_cache(maxsize=32)
+def _split_paths(s: str) -> tuple:
+    """Entries of a user path list; existence filtering stays with the
+    caller (it's I/O and must not be cached)."""
+    return tuple(p.strip() for p in _PATH_SPLIT.split(s) if p.strip())
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  PDF export worker
+# ═════════════════════════════════════════════════════════════════════════════
+class PdfExportThread(QThread):
+    """Renders the System Log to a PDF file off the GUI thread.
+
+    QTextDocument.setHtml() layout cost grows non-linearly with document
+    size — seconds for a multi-MB log — so the whole build-and-paint runs
+    here.  QPdfWriter (unlike QPrinter) can be painted on from any thread,
+    and is a QPagedPaintDevice, so print_() paginates for free.
+    """
+
+    done_signal = Signal(bool, str)   # (ok, saved-path or error text)
+
+    def __init__(self, path, entries, parent=None):
+        super().__init__(parent)
+        self._path = path
+        self._entries = entries   # snapshot of (text, color) pairs
+
+    def run(self):
+        try:
+            from PySide6.QtGui import QPdfWriter
+            import PySide6.QtPrintSupport  # noqa: F401 — enables doc.print_
+            writer = QPdfWriter(self._path)
+            body = "".join(
+                f"<span style='color:{c}'>{t.translate(_HTML_ESCAPE)}</span>\n"
+                for t, c in self._entries
+            )
+            doc = QTextDocument()
+            doc.setHtml(
+                f"<pre style='font-family:monospace;'>{body}</pre>"
+            )
+            doc.print_(writer)
+            self.done_signal.emit(True, self._path)
+        except Exception as e:
+            self.done_signal.emit(False, str(e))
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Stylesheet
+# ═════════════════════════════════════════════════════════════════════════════
+STYLESHEET = """
+    * { box-sizing: border-box; }
+    QMainWindow, QWidget        { background: #0c0e18; color: #dde1ec; }
+    QSplitter::handle           { background: #181b2a; }
+
+    QLineEdit {
+        background: #13162a;
+        color: #dde1ec;
+        border: 1px solid #252840;
+        border-radius: 5px;
+        padding: 6px 10px;
+        font-size: 12px;
+    }
+    QLineEdit:focus     { border: 1px solid #00d4aa; }
+    QLineEdit:disabled  { background: #0d0f1a; color: #2d3148; }
+
+    QPushButton {
+        background: #181b2e;
+        color: #8892a4;
+        border: 1px solid #252840;
+        border-radius: 5px;
+        padding: 6px 14px;
+        font-size: 12px;
+        font-weight: 600;
+    }
+    QPushButton:hover    { background: #20243a; border-color: #00d4aa88; color: #00d4aa; }
+    QPushButton:disabled { background: #0e101a; color: #2d3148; border-color: #181b2a; }
+
+    QPushButton#run_btn {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+            stop:0 #009e7a, stop:1 #00c99e);
+        color: #051a14;
+        border: none;
+        font-weight: 700;
+        font-size: 12px;
+        letter-spacing: 0.5px;
+    }
+    QPushButton#run_btn:hover    { background: #00e4b5; color: #020f0b; }
+    QPushButton#run_btn:disabled { background: #0d1f19; color: #1a3d2e; border: none; }
+
+    QPushButton#stop_btn {
+        background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
+            stop:0 #9b1c1c, stop:1 #dc2626);
+        color: #fff;
+        border: none;
+        font-weight: 700;
+        font-size: 12px;
+    }
+    QPushButton#stop_btn:hover    { background: #ef4444; }
+    QPushButton#stop_btn:disabled { background: #130a0a; color: #3d1515; border: none; }
+
+    QGroupBox {
+        border: 1px solid #1c1f34;
+        border-radius: 7px;
+        margin-top: 14px;
+        padding-top: 4px;
+        font-size: 10px;
+        font-weight: 700;
+        letter-spacing: 2px;
+        color: #2e3555;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 6px;
+        background: #0c0e18;
+    }
+
+    QPlainTextEdit {
+        background: #07090f;
+        color: #b8c2d8;
+        border: 1px solid #1c1f34;
+        border-radius: 6px;
+        font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;
+        font-size: 11px;
+        padding: 6px 8px;
+        selection-background-color: #00d4aa30;
+    }
+
+    QFrame#StatBadge {
+        background: #0f1120;
+        border: 1px solid #1c1f34;
+        border-radius: 7px;
+    }
+
+    QCheckBox { color: #3d4460; font-size: 11px; spacing: 6px; }
+    QCheckBox::indicator {
+        width: 13px; height: 13px;
+        border: 1px solid #252840;
+        border-radius: 3px;
+        background: #13162a;
+    }
+    QCheckBox::indicator:checked { background: #00d4aa; border-color: #00d4aa; }
+
+    QLabel#sec { color: #2e3555; font-size: 10px; letter-spacing: 1.5px; }
+
+    QScrollBar:vertical   { background: #07090f; width: 7px; }
+    QScrollBar::handle:vertical {
+        background: #252840; border-radius: 3px; min-height: 20px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height: 0; }
+    QScrollBar:horizontal { background: #07090f; height: 7px; }
+    QScrollBar::handle:horizontal {
+        background: #252840; border-radius: 3px; min-width: 20px;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal { width: 0; }
+"""
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Main window
+# ═════════════════════════════════════════════════════════════════════════════
+class AnalyzerApp(QMainWindow):
+    _X_WINDOW = 120.0        # seconds of history shown; X scrolls past this
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Analyzer Pro")
+        self.resize(1280, 900)
+        self.setMinimumSize(920, 660)
+
+        # Icon resolution — works for source, PyInstaller _MEIPASS, and Nuitka
+        icon_path = self._resolve_asset("analyzer.ico")
+        if icon_path:
+            self.setWindowIcon(QIcon(icon_path))
+
+        # Fixed-size ring buffers: memory stays bounded on multi-hour runs
+        # and pyqtgraph always receives a contiguous float64 array instead
+        # of re-converting an ever-growing Python list per redraw.
+        self._N         = 3600                      # 1 h at 1 Hz
+        self.time_data  = np.zeros(self._N, dtype=np.float64)
+        self.mem_data   = np.zeros(self._N, dtype=np.float64)
+        self.cpu_data   = np.zeros(self._N, dtype=np.float64)
+        self._head      = 0                         # next write slot
+        self._filled    = 0                         # valid samples
+        # Source of truth for exports — the widget only displays. Bounded to
+        # match the pane's block cap so both drop history in lockstep.
+        self._log_entries = collections.deque(maxlen=5000)
+        self.monitor_thread = None
+        self._pdf_thread = None
+        self._fmts = {}   # colour hex → QTextCharFormat, filled by _fmt()
+        # Lines arriving while minimized — replayed on restore (changeEvent).
+        # Bounded to the panes' block cap: anything beyond it would be
+        # laid out on restore only to be dropped by the 5000-block limit.
+        self._pending_out = collections.deque(maxlen=5000)
+        self._pending_log = collections.deque(maxlen=5000)
+
+        # Incoming samples buffer here; a single-shot ~30 fps timer drains
+        # them, so the UI never redraws faster than the display regardless
+        # of the sampler's cadence (history is kept, not just the latest).
+        # Manual plot ranges — auto-range would rescan the data per update
+        self._xmax = self._X_WINDOW
+        self._ymax = {"mem": 1.0, "cpu": 1.0}
+
+        self._pending_stats = []
+        self._stats_timer   = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(33)
+        self._stats_timer.timeout.connect(self._flush_stats)
+
+        # Current resolved Python executable (can be overridden by user)
+        self._python_exe = get_python_executable()
+
+        self._build_ui()
+
+        # Warn if no interpreter was found at startup
+        if not self._python_exe or not os.path.isfile(self._python_exe):
+            self._log(
+                "WARNING  ▸  Could not auto-detect a Python interpreter. "
+                "Please set one manually via the Python field above.",
+                "#fbbf24",
+            )
+        else:
+            self._log(f"PYTHON ▸  {self._python_exe}", "#3a3f5c")
+
+    @staticmethod
+    def _resolve_asset(filename: str) -> str:
+        """Find a bundled asset regardless of run mode."""
+        # 1. PyInstaller _MEIPASS temp dir
+        meipass = getattr(sys, "_MEIPASS", None)
+        if meipass:
+            p = os.path.join(meipass, filename)
+            if os.path.isfile(p):
+                return p
+        # 2. Nuitka: assets are next to the executable
+        exe_dir = os.path.dirname(os.path.abspath(sys.executable))
+        p = os.path.join(exe_dir, filename)
+        if os.path.isfile(p):
+            return p
+        # 3. Source run: same directory as this script
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        p = os.path.join(script_dir, filename)
+        if os.path.isfile(p):
+            return p
+        return ""
+
+    # ── Label helper ─────────────────────────────────────────────────────────
+    def _sec(self, text):
+        lbl = QLabel(text.upper())
+        lbl.setObjectName("sec")
+        return lbl
+
+    # ── Build UI ─────────────────────────────────────────────────────────────
+    def _build_ui(self):
+        root_w = QWidget()
+        self.setCentralWidget(root_w)
+        root = QVBoxLayout(root_w)
+        root.setContentsMargins(12, 8, 12, 8)
+        root.setSpacing(5)
+
+        # ── Header ────────────────────────────────────────────────────────────
+        hdr = QHBoxLayout(); hdr.setSpacing(0)
+        t1 = QLabel("ANALYZER")
+        t1.setStyleSheet(
+            "color: #00d4aa; font-size: 14px; font-weight: 800; letter-spacing: 5px;"
+            " font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;"
+        )
+        t2 = QLabel(" PRO")
+        t2.setStyleSheet(
+            "color: #60a5fa; font-size: 14px; font-weight: 800; letter-spacing: 5px;"
+            " font-family: 'JetBrains Mono','Cascadia Code','Consolas',monospace;"
+        )
+        sub = QLabel("  ·  Python Dynamic Performance Profiler")
+        sub.setStyleSheet("color: #2e3555; font-size: 10px; letter-spacing: 0.5px;")
+        hdr.addWidget(t1); hdr.addWidget(t2); hdr.addWidget(sub)
+        hdr.addStretch()
+        root.addLayout(hdr)
+        root.addWidget(AccentBar("#00d4aa", "#60a5fa"))
+        root.addSpacing(1)
+
+        # ── Config ────────────────────────────────────────────────────────────
+        cfg = QGroupBox("Configuration")
+        cfl = QVBoxLayout(cfg)
+        cfl.setSpacing(6)
+        cfl.setContentsMargins(10, 16, 10, 8)
+
+        # Row 0: Python interpreter (critical for frozen builds)
+        r0 = QHBoxLayout(); r0.setSpacing(6)
+        r0.addWidget(self._sec("Python  "))
+        self.python_input = QLineEdit()
+        self.python_input.setText(self._python_exe)
+        self.python_input.setPlaceholderText(
+            "Path to python.exe / python3  (auto-detected) …"
+        )
+        # editingFinished (Enter / focus-out) — not per keystroke
+        self.python_input.editingFinished.connect(self._on_python_changed)
+        btn_py = QPushButton("Browse"); btn_py.setFixedWidth(78)
+        btn_py.clicked.connect(self.browse_python)
+        r0.addWidget(self.python_input); r0.addWidget(btn_py)
+        cfl.addLayout(r0)
+
+        # Row 1: Script
+        r1 = QHBoxLayout(); r1.setSpacing(6)
+        r1.addWidget(self._sec("Script  "))
+        self.file_input = QLineEdit()
+        self.file_input.setPlaceholderText("Select Python entry-point  (*.py) …")
+        btn_f = QPushButton("Browse"); btn_f.setFixedWidth(78)
+        btn_f.clicked.connect(self.browse_file)
+        r1.addWidget(self.file_input); r1.addWidget(btn_f)
+        cfl.addLayout(r1)
+
+        # Row 2: Working dir
+        r2 = QHBoxLayout(); r2.setSpacing(6)
+        r2.addWidget(self._sec("Work Dir"))
+        self.cwd_input = QLineEdit()
+        self.cwd_input.setPlaceholderText("Defaults to script's parent folder …")
+        btn_d = QPushButton("Browse"); btn_d.setFixedWidth(78)
+        btn_d.clicked.connect(self.browse_dir)
+        self.auto_cwd_chk = QCheckBox("Auto")
+        self.auto_cwd_chk.setChecked(True)
+        self.auto_cwd_chk.stateChanged.connect(self._toggle_cwd)
+        self._toggle_cwd(Qt.Checked)
+        r2.addWidget(self.cwd_input); r2.addWidget(btn_d); r2.addWidget(self.auto_cwd_chk)
+        cfl.addLayout(r2)
+
+        # Row 3: Extra paths + args
+        r3 = QHBoxLayout(); r3.setSpacing(12)
+        pc = QVBoxLayout(); pc.setSpacing(4)
+        pc.addWidget(self._sec("Extra PYTHONPATH"))
+        ep = QHBoxLayout(); ep.setSpacing(4)
+        self.extra_path_input = QLineEdit()
+        self.extra_path_input.setPlaceholderText(
+            "Additional paths (auto-discovers by default) …"
+        )
+        btn_ep = QPushButton("+"); btn_ep.setFixedWidth(30)
+        btn_ep.clicked.connect(self.add_extra_path)
+        ep.addWidget(self.extra_path_input); ep.addWidget(btn_ep)
+        pc.addLayout(ep)
+
+        ac = QVBoxLayout(); ac.setSpacing(4)
+        ac.addWidget(self._sec("Arguments"))
+        self.args_input = QLineEdit()
+        self.args_input.setPlaceholderText(
+            "--debug  --port 8080  --config cfg.yaml …"
+        )
+        ac.addWidget(self.args_input)
+
+        r3.addLayout(pc, 3); r3.addLayout(ac, 2)
+        cfl.addLayout(r3)
+        root.addWidget(cfg)
+
+        # ── Action row ────────────────────────────────────────────────────────
+        ar = QHBoxLayout(); ar.setSpacing(6)
+        self.run_btn = QPushButton("▶  Run & Analyze")
+        self.run_btn.setObjectName("run_btn")
+        self.run_btn.setFixedHeight(30); self.run_btn.setFixedWidth(160)
+        self.run_btn.clicked.connect(self.start_analysis)
+
+        self.stop_btn = QPushButton("■  Stop")
+        self.stop_btn.setObjectName("stop_btn")
+        self.stop_btn.setFixedHeight(30); self.stop_btn.setFixedWidth(90)
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self.stop_analysis)
+
+        btn_clr = QPushButton("Clear")
+        btn_clr.setFixedHeight(30); btn_clr.setFixedWidth(64)
+        btn_clr.clicked.connect(self.clear_output)
+
+        self.merge_chk = QCheckBox("Merged output")
+        self.merge_chk.setToolTip(
+            "Fold stderr into the stdout pipe — halves pipe wakeups on very "
+            "verbose scripts, at the cost of stream separation."
+        )
+
+        ar.addWidget(self.run_btn); ar.addWidget(self.stop_btn)
+        ar.addWidget(btn_clr); ar.addWidget(self.merge_chk); ar.addStretch()
+        root.addLayout(ar)
+
+        # ── Stat badges (own container so repaints coalesce per row) ──────────
+        self.badge_row = QWidget()
+        br = QHBoxLayout(self.badge_row)
+        br.setContentsMargins(0, 0, 0, 0); br.setSpacing(6)
+        self.b_status  = StatBadge("Status",   "",     "#00d4aa")
+        self.b_ram     = StatBadge("Memory",   "MB",   "#c084fc")
+        self.b_cpu     = StatBadge("CPU",      "%",    "#fbbf24")
+        self.b_threads = StatBadge("Threads",  "thr",  "#60a5fa")
+        self.b_child   = StatBadge("Children", "proc", "#f87171")
+        self.b_status.set_value("IDLE")
+        for b in [self.b_status, self.b_ram, self.b_cpu, self.b_threads, self.b_child]:
+            br.addWidget(b)
+        root.addWidget(self.badge_row)
+        root.addSpacing(2)
+
+        # ── Splitter ──────────────────────────────────────────────────────────
+        vs = QSplitter(Qt.Vertical); vs.setHandleWidth(4)
+
+        # Graphs — side by side (pyqtgraph deferred to here, see module top)
+        import pyqtgraph as pg
+
+        # GPU rasterization when PyOpenGL is installed; CPU path otherwise.
+        gl_opts = {}
+        try:
+            import OpenGL                          # noqa: F401
+            gl_opts = {"useOpenGL": True, "enableExperimental": True}
+        except ImportError:
+            pass
+
+        gg = QGroupBox("Real-time Metrics")
+        ggl = QVBoxLayout(gg); ggl.setContentsMargins(4, 16, 4, 4)
+        # AA off: at 1.5 px stroke width on a dark theme it is imperceptible
+        # but roughly doubles raster cost for every curve update.
+        pg.setConfigOptions(antialias=False, background="#07090f",
+                            foreground="#2e3555", **gl_opts)
+        self.gw = pg.GraphicsLayoutWidget()
+        self.gw.setBackground("#07090f")
+        self.gw.setFixedHeight(170)
+
+        self.plot_mem = self.gw.addPlot(row=0, col=0)
+        # Peak-binned downsampling caps drawn points at the plot width
+        # (min/max per pixel bucket, so spikes stay visible) and clipping
+        # skips samples outside the visible range before path building.
+        self.plot_mem.setDownsampling(auto=True, mode="peak")
+        self.plot_mem.setClipToView(True)
+        # Ranges are driven manually from _flush_stats; auto-range would
+        # min/max-scan the whole series on every setData.
+        self.plot_mem.enableAutoRange(x=False, y=False)
+        self.plot_mem.setXRange(0, self._X_WINDOW, padding=0)
+        self.plot_mem.setYRange(0, self._ymax["mem"], padding=0)
+        self.plot_mem.showGrid(x=True, y=True, alpha=0.10)
+        self.plot_mem.setLabel("left", "Memory MB", color="#c084fc", size="9pt")
+        self.plot_mem.getAxis("left").setPen(pg.mkPen("#1c1f34"))
+        self.plot_mem.getAxis("bottom").setPen(pg.mkPen("#1c1f34"))
+        self.plot_mem.getAxis("left").setTextPen(pg.mkPen("#3a3f5c"))
+        self.plot_mem.getAxis("bottom").setTextPen(pg.mkPen("#3a3f5c"))
+        self.curve_mem = self.plot_mem.plot(
+            pen=pg.mkPen("#c084fc", width=1.5),
+            fillLevel=0, brush=(192, 132, 252, 20),
+        )
+
+        self.plot_cpu = self.gw.addPlot(row=0, col=1)
+        self.plot_cpu.setDownsampling(auto=True, mode="peak")
+        self.plot_cpu.setClipToView(True)
+        self.plot_cpu.enableAutoRange(x=False, y=False)
+        self.plot_cpu.setXRange(0, self._X_WINDOW, padding=0)
+        self.plot_cpu.setYRange(0, self._ymax["cpu"], padding=0)
+        self.plot_cpu.showGrid(x=True, y=True, alpha=0.10)
+        self.plot_cpu.setLabel("left", "CPU %", color="#fbbf24", size="9pt")
+        self.plot_cpu.getAxis("left").setPen(pg.mkPen("#1c1f34"))
+        self.plot_cpu.getAxis("bottom").setPen(pg.mkPen("#1c1f34"))
+        self.plot_cpu.getAxis("left").setTextPen(pg.mkPen("#3a3f5c"))
+        self.plot_cpu.getAxis("bottom").setTextPen(pg.mkPen("#3a3f5c"))
+        self.curve_cpu = self.plot_cpu.plot(
+            pen=pg.mkPen("#fbbf24", width=1.5),
+            fillLevel=0, brush=(251, 191, 36, 20),
+        )
+
+        ggl.addWidget(self.gw)
+        vs.addWidget(gg)
+
+        # Output panes
+        hs = QSplitter(Qt.Horizontal); hs.setHandleWidth(4)
+
+        og = QGroupBox("Program Output — stdout")
+        ogl = QVBoxLayout(og); ogl.setContentsMargins(6, 16, 6, 6); ogl.setSpacing(4)
+        # QPlainTextEdit appends in O(1); the block cap drops old lines
+        # instead of letting the document (and layout cost) grow forever.
+        self.stdout_area = QPlainTextEdit(); self.stdout_area.setReadOnly(True)
+        self.stdout_area.setMaximumBlockCount(5000)
+        self.stdout_area.setUndoRedoEnabled(False)
+        self.stdout_area.document().setDocumentMargin(8)
+        ogl.addWidget(self.stdout_area)
+        hs.addWidget(og)
+
+        lg = QGroupBox("System Log — stderr / events")
+        lgl = QVBoxLayout(lg); lgl.setContentsMargins(6, 16, 6, 6); lgl.setSpacing(4)
+        self.report_area = QPlainTextEdit(); self.report_area.setReadOnly(True)
+        self.report_area.setMaximumBlockCount(5000)
+        self.report_area.setUndoRedoEnabled(False)
+        self.report_area.document().setDocumentMargin(8)
+        lgl.addWidget(self.report_area)
+
+        exr = QHBoxLayout(); exr.setSpacing(5)
+        bp = QPushButton("Export PDF"); bp.setFixedHeight(24)
+        bc = QPushButton("Export CSV"); bc.setFixedHeight(24)
+        bp.clicked.connect(self.export_pdf)
+        bc.clicked.connect(self.export_csv)
+        exr.addWidget(bp); exr.addWidget(bc); exr.addStretch()
+        lgl.addLayout(exr)
+
+        hs.addWidget(lg)
+        hs.setSizes([620, 620])
+        vs.addWidget(hs)
+        vs.setSizes([190, 520])
+        root.addWidget(vs)
+
+    # ── UI helpers ───────────────────────────────────────────────────────────
+    def _toggle_cwd(self, state):
+        self.cwd_input.setEnabled(state != Qt.Checked)
+
+    def _on_python_changed(self):
+        self._python_exe = self.python_input.text().strip()
+
+    def browse_python(self):
+        if sys.platform == "win32":
+            filt = "Python Executable (python.exe python3.exe);;All Files (*)"
+        else:
+            filt = "Python Executable (python python3);;All Files (*)"
+        p, _ = QFileDialog.getOpenFileName(self, "Select Python Interpreter", "", filt)
+        if p:
+            self._python_exe = p
+            self.python_input.setText(p)
+
+    def browse_file(self):
+        p, _ = QFileDialog.getOpenFileName(
+            self, "Select Entry-point Script", "", "Python Files (*.py)"
+        )
+        if p:
+            self.file_input.setText(p)
+            if self.auto_cwd_chk.isChecked():
+                self.cwd_input.setText(os.path.dirname(p))
+            # Warm the target's __pycache__ while the user is still setting
+            # up the run — keeps importer compile cost out of the first
+            # second of samples.
+            exe = self.python_input.text().strip() or self._python_exe
+            if exe:
+                QThreadPool.globalInstance().start(
+                    _BytecodeWarmupTask(exe, os.path.dirname(p))
+                )
+
+    def browse_dir(self):
+        p = QFileDialog.getExistingDirectory(
+            self, "Select Working / Project Directory"
+        )
+        if p:
+            self.auto_cwd_chk.setChecked(False)
+            self.cwd_input.setEnabled(True)
+            self.cwd_input.setText(p)
+
+    def add_extra_path(self):
+        p = QFileDialog.getExistingDirectory(
+            self, "Add Extra PYTHONPATH Directory"
+        )
+        if p:
+            cur = self.extra_path_input.text().strip()
+            sep = os.pathsep
+            self.extra_path_input.setText(f"{cur}{sep}{p}" if cur else p)
+
+    def clear_output(self):
+        self.stdout_area.clear()
+        self.report_area.clear()
+        self._log_entries.clear()
+        self._pending_out.clear()
+        self._pending_log.clear()
+
+    @staticmethod
+    def _pinned(widget):
+        """Whether the user is pinned to the bottom of *widget*.
+
+        Must be read BEFORE mutating the document: a multi-line insert (the
+        batches carry up to 64 lines) moves maximum() far past value(), so
+        sampling afterwards would report unpinned and stop following."""
+        sb = widget.verticalScrollBar()
+        return sb.value() >= sb.maximum() - 4
+
+    @staticmethod
+    def _scroll_bottom(widget):
+        """Follow output with one scrollbar poke instead of a cursor move +
+        layout pass per append; scrollback inspection survives a chatty
+        target because the caller only scrolls while _pinned() held."""
+        sb = widget.verticalScrollBar()
+        sb.setValue(sb.maximum())
+
+    def _fmt(self, color):
+        """Char format for a log colour, built once per colour ever used.
+
+        The palette is a handful of fixed hex strings, so caching turns the
+        per-line QTextCharFormat + QColor allocation into a dict lookup."""
+        fmt = self._fmts.get(color)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._fmts[color] = fmt
+        return fmt
+
+    def _log(self, text, color="#2e3555"):
+        # Plain-text insert with a cached char format — no HTML parse, no
+        # escaping; batched emissions may carry several lines in one chunk.
+        self._log_entries.append((text, color))
+        if self.windowState() & Qt.WindowMinimized:
+            # No point laying out text nobody can see — park it until the
+            # window comes back (changeEvent drains the buffer).
+            self._pending_log.append((text, color))
+            return
+        pinned = self._pinned(self.report_area)
+        cur = self.report_area.textCursor()
+        cur.movePosition(QTextCursor.End)
+        cur.insertText(text + "\n", self._fmt(color))
+        if pinned:
+            self._scroll_bottom(self.report_area)
+
+    def _out(self, text):
+        if self.windowState() & Qt.WindowMinimized:
+            self._pending_out.append(text)
+            return
+        pinned = self._pinned(self.stdout_area)
+        # Pane colour comes from the QPlainTextEdit stylesheet
+        self.stdout_area.appendPlainText(text)
+        if pinned:
+            self._scroll_bottom(self.stdout_area)
+
+    def changeEvent(self, event):
+        # Returning from minimized: replay everything buffered while text
+        # layout was pointless. stdout goes in as one append; log entries
+        # keep their colours via one cursor pass.
+        if (event.type() == QEvent.WindowStateChange
+                and not self.windowState() & Qt.WindowMinimized):
+            if self._pending_out:
+                pinned = self._pinned(self.stdout_area)
+                self.stdout_area.appendPlainText("\n".join(self._pending_out))
+                self._pending_out.clear()
+                if pinned:
+                    self._scroll_bottom(self.stdout_area)
+            if self._pending_log:
+                pinned = self._pinned(self.report_area)
+                cur = self.report_area.textCursor()
+                cur.movePosition(QTextCursor.End)
+                for text, color in self._pending_log:
+                    cur.insertText(text + "\n", self._fmt(color))
+                self._pending_log.clear()
+                if pinned:
+                    self._scroll_bottom(self.report_area)
+        super().changeEvent(event)
+
+    # ── Analysis lifecycle ────────────────────────────────────────────────────
+    def start_analysis(self):
+        # Validate Python interpreter — one stat() per candidate via _path_kind
+        python_exe = self.python_input.text().strip() or self._python_exe
+        if not python_exe or _path_kind(python_exe) != stat.S_IFREG:
+            self._log(
+                "ERROR  ▸  Python interpreter not found. "
+                "Please browse to python.exe manually.",
+                "#ef4444",
+            )
+            return
+
+        # Validate script
+        script_path = self.file_input.text().strip()
+        if not script_path or not _path_kind(script_path):
+            self._log("ERROR  ▸  Script file not found.", "#ef4444")
+            return
+
+        # Working directory
+        if self.auto_cwd_chk.isChecked() or not self.cwd_input.text().strip():
+            cwd = os.path.dirname(os.path.abspath(script_path))
+        else:
+            cwd = self.cwd_input.text().strip()
+            if _path_kind(cwd) != stat.S_IFDIR:
+                self._log(f"ERROR  ▸  Working directory not found: {cwd}", "#ef4444")
+                return
+
+        # Extra PYTHONPATH
+        raw_extra = self.extra_path_input.text().strip()
+        extra_paths = [
+            p for p in _split_paths(raw_extra)
+            if _path_kind(p) == stat.S_IFDIR
+        ]
+
+        # Script arguments
+        extra_args = list(_split_args(self.args_input.text().strip()))
+
+        # Reset
+        self.clear_output()
+        self._head = self._filled = 0
+        self._pending_stats.clear()
+        self._xmax = self._X_WINDOW
+        self._ymax = {"mem": 1.0, "cpu": 1.0}
+        self.plot_mem.setXRange(0, self._X_WINDOW, padding=0)
+        self.plot_mem.setYRange(0, self._ymax["mem"], padding=0)
+        self.plot_cpu.setXRange(0, self._X_WINDOW, padding=0)
+        self.plot_cpu.setYRange(0, self._ymax["cpu"], padding=0)
+        self.curve_mem.setData([], []); self.curve_cpu.setData([], [])
+
+        self._log(f"START  ▸  {os.path.basename(script_path)}", "#00d4aa")
+        self._log(f"CWD    ▸  {cwd}", "#60a5fa")
+        if extra_paths: self._log(f"PATHS  ▸  {extra_paths}", "#a78bfa")
+        if extra_args:  self._log(f"ARGS   ▸  {extra_args}", "#a78bfa")
+        self._log("─" * 60, "#1c1f34")
+
+        self.run_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.b_status.set_value("RUN", "#00d4aa")
+
+        self.monitor_thread = ProcessMonitorThread(
+            script_path,
+            python_exe=python_exe,
+            extra_paths=extra_paths,
+            extra_args=extra_args,
+            custom_cwd=cwd,
+            merge_output=self.merge_chk.isChecked(),
+        )
+        # Explicitly queued: emitters live on worker threads, and auto
+        # connection resolution per emit is pure overhead on these hot paths.
+        self.monitor_thread.stats_signal.connect(
+            self._update_stats, Qt.QueuedConnection)
+        self.monitor_thread.finished_signal.connect(
+            self._finish_analysis, Qt.QueuedConnection)
+        self.monitor_thread.log_signal.connect(
+            lambda t: self._log(t, "#3a3f5c"), Qt.QueuedConnection)
+        self.monitor_thread.stdout_signal.connect(
+            self._out, Qt.QueuedConnection)
+        self.monitor_thread.stderr_signal.connect(
+            lambda l: self._log(l, "#f87171"), Qt.QueuedConnection)
+        self.monitor_thread.start()
+
+    # ── Metric ring buffer ───────────────────────────────────────────────────
+    def _push_sample(self, t, mem, cpu):
+        i = self._head
+        self.time_data[i] = t
+        self.mem_data[i]  = mem
+        self.cpu_data[i]  = cpu
+        self._head   = (i + 1) % self._N
+        self._filled = min(self._filled + 1, self._N)
+
+    def _ordered_samples(self):
+        """Return (time, mem, cpu) arrays in chronological order."""
+        if self._filled < self._N:
+            sl = slice(0, self._filled)
+            return self.time_data[sl], self.mem_data[sl], self.cpu_data[sl]
+        h = self._head
+        return (
+            np.concatenate((self.time_data[h:], self.time_data[:h])),
+            np.concatenate((self.mem_data[h:],  self.mem_data[:h])),
+            np.concatenate((self.cpu_data[h:],  self.cpu_data[:h])),
+        )
+
+    def _apply_badges(self, mem, cpu, threads, children):
+        # Suspend row updates so four setText calls paint once, not four times
+        self.badge_row.setUpdatesEnabled(False)
+        try:
+            self.b_ram.set_value(f"{mem:.1f}")
+            self.b_cpu.set_value(f"{cpu:.1f}")
+            self.b_threads.set_value(str(threads))
+            self.b_child.set_value(str(children))
+        finally:
+            self.badge_row.setUpdatesEnabled(True)
+
+    def _update_stats(self, data):
+        # Slot for stats_signal: buffer and schedule a frame-rate flush
+        self._pending_stats.append(data)
+        if not self._stats_timer.isActive():
+            self._stats_timer.start()
+
+    def _flush_stats(self):
+        if not self._pending_stats:
+            return
+        pending, self._pending_stats = self._pending_stats, []
+        for data in pending:
+            self._push_sample(data.time, data.mem_mb, data.cpu_percent)
+        last = pending[-1]
+        self._apply_badges(last.mem_mb, last.cpu_percent,
+                           last.threads, last.children)
+        t, m, c = self._ordered_samples()
+        # Ring-buffer samples are always finite floats — skip the per-update
+        # O(N) isfinite scan and the connect-array build inside setData.
+        self.curve_mem.setData(t, m, skipFiniteCheck=True, connect="all")
+        self.curve_cpu.setData(t, c, skipFiniteCheck=True, connect="all")
+
+        # Scroll the X window only once the newest sample passes its edge
+        t_last = last.time
+        if t_last > self._xmax:
+            self._xmax = t_last
+            x0 = max(0.0, t_last - self._X_WINDOW)
+            self.plot_mem.setXRange(x0, t_last, padding=0)
+            self.plot_cpu.setXRange(x0, t_last, padding=0)
+
+        # Grow the Y envelope with 5% headroom on exceedance; never shrink
+        # mid-run, so routine samples cost no range recomputation.
+        mem_peak = max(d.mem_mb for d in pending)
+        cpu_peak = max(d.cpu_percent for d in pending)
+        if mem_peak > self._ymax["mem"]:
+            self._ymax["mem"] = mem_peak * 1.05
+            self.plot_mem.setYRange(0, self._ymax["mem"], padding=0)
+        if cpu_peak > self._ymax["cpu"]:
+            self._ymax["cpu"] = cpu_peak * 1.05
+            self.plot_cpu.setYRange(0, self._ymax["cpu"], padding=0)
+
+    def stop_analysis(self):
+        if self.monitor_thread and self.monitor_thread.isRunning():
+            self.monitor_thread.stop_process()
+            self.stop_btn.setEnabled(False)
+
+    def _finish_analysis(self, result):
+        self.run_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+
+        # Surface any launch error prominently
+        if result.get("error"):
+            self._log(f"ERROR  ▸  {result['error']}", "#ef4444")
+            self.b_status.set_value("ERR", "#ef4444")
+            self._log("─" * 60, "#1c1f34")
+            return
+
+        exit_code = result.get("exit_code")
+        ok = exit_code == 0
+        self.b_status.set_value("OK" if ok else "ERR",
+                                "#00d4aa" if ok else "#ef4444")
+        self._log("─" * 60, "#1c1f34")
+        self._log("RESULTS", "#60a5fa")
+        if exit_code is not None:
+            self._log(f"Exit Code  ▸  {exit_code}",
+                      "#00d4aa" if ok else "#ef4444")
+        # Output that spilled past the in-memory threshold lives on disk —
+        # tell the user where, since the inline payload is empty then.
+        for label, key in (("stdout", "stdout_path"),
+                           ("stderr", "stderr_path")):
+            path = result.get(key)
+            if path:
+                self._log(f"Full {label} saved  ▸  {path}", "#fbbf24")
+        zombies = result.get("zombies", [])
+        if zombies:
+            self._log("LEAKED PROCESSES:", "#ef4444")
+            for z in zombies:
+                self._log(f"  · {z}", "#fbbf24")
+            self._log("Tip: use daemon=True on background threads.", "#4b5563")
+        else:
+            self._log("No leaked / zombie processes detected.", "#00d4aa")
+        self._log("─" * 60, "#1c1f34")
+
+    # ── Export ────────────────────────────────────────────────────────────────
+    def export_pdf(self):
+        if not self._log_entries:
+            self._log("WARNING  ▸  Nothing to export.", "#fbbf24"); return
+        if self._pdf_thread is not None and self._pdf_thread.isRunning():
+            self._log("WARNING  ▸  PDF export already running.", "#fbbf24")
+            return
+        p, _ = QFileDialog.getSaveFileName(
+            self, "Save PDF", "analysis_log.pdf", "PDF Files (*.pdf)"
+        )
+        if p:
+            # Render on a worker thread — HTML build + text layout for a big
+            # log can take seconds, and none of it needs the GUI thread.
+            # The deque is snapshotted so live appends can't race the render.
+            self._pdf_thread = PdfExportThread(p, list(self._log_entries), self)
+            self._pdf_thread.done_signal.connect(
+                self._on_pdf_done, Qt.QueuedConnection
+            )
+            self._pdf_thread.start()
+            self._log("Exporting PDF in background …", "#4b5563")
+
+    def _on_pdf_done(self, ok, msg):
+        if ok:
+            self._log(f"PDF saved  ▸  {msg}", "#00d4aa")
+        else:
+            self._log(f"ERROR  ▸  {msg}", "#ef4444")
+        self._pdf_thread = None
+
+    def export_csv(self):
+        if not self._filled:
+            self._log("WARNING  ▸  No metrics yet.", "#fbbf24"); return
+        p, _ = QFileDialog.getSaveFileName(
+            self, "Save CSV", "metrics.csv", "CSV Files (*.csv)"
+        )
+        if p:
+            try:
+                times, mems, cpus = self._ordered_samples()
+                # One vectorized dump instead of a writerow call per sample
+                arr = np.column_stack((times, mems, cpus))
+                with open(p, "w", newline="", encoding="utf-8") as f:
+                    np.savetxt(
+                        f, arr, delimiter=",", fmt="%.6g",
+                        header="Time (s),Memory (MB),CPU (%)", comments="",
+                    )
+                self._log(f"CSV saved  ▸  {p}", "#00d4aa")
+            except Exception as e:
+                self._log(f"ERROR  ▸  {e}", "#ef4444")
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+#  Entry point
+# ═════════════════════════════════════════════════════════════════════════════
+if __name__ == "__main__":
+    # Nuitka: bootstrap multiprocessing support (must be first)
+    if "__compiled__" in dir(sys):
+        import multiprocessing
+        multiprocessing.freeze_support()
+
+    # PyInstaller: bootstrap multiprocessing support
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+
+    # Force UTF-8 for the analyzer process itself on Windows
+    if sys.platform == "win32":
+        import io
+        if hasattr(sys.stdout, "buffer"):
+            sys.stdout = io.TextIOWrapper(
+                sys.stdout.buffer, encoding="utf-8", errors="replace"
+            )
+        if hasattr(sys.stderr, "buffer"):
+            sys.stderr = io.TextIOWrapper(
+                sys.stderr.buffer, encoding="utf-8", errors="replace"
+            )
+
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    pal = QPalette()
+    pal.setColor(QPalette.Window,          QColor("#0c0e18"))
+    pal.setColor(QPalette.WindowText,      QColor("#dde1ec"))
+    pal.setColor(QPalette.Base,            QColor("#07090f"))
+    pal.setColor(QPalette.AlternateBase,   QColor("#13162a"))
+    pal.setColor(QPalette.Text,            QColor("#dde1ec"))
+    pal.setColor(QPalette.Button,          QColor("#181b2e"))
+    pal.setColor(QPalette.ButtonText,      QColor("#dde1ec"))
+    pal.setColor(QPalette.Highlight,       QColor("#00d4aa"))
+    pal.setColor(QPalette.HighlightedText, QColor("#040e0c"))
+    app.setPalette(pal)
+    # Application-wide: Qt parses the sheet once and shares the rule tree
+    # with every window, instead of re-parsing per QMainWindow construction.
+    app.setStyleSheet(STYLESHEET)
+
+    w = AnalyzerApp()
+    w.show()
+    sys.exit(app.exec())